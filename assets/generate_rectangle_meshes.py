@@ -1,3 +1,5 @@
+import os
+
 import gmsh
 
 X = 0.2
@@ -6,12 +8,8 @@ Y = 0.3
 N_X = 3
 N_Y = 4
 
-for coefficient, name in zip([1, 2, 4], ["rectangle-coarse-elements", "rectangle-middle-elements", "rectangle-fine-elements"]):
-
-    gmsh.initialize()
-
-    gmsh.model.add(f"{name}")
 
+def build(coefficient: int) -> None:
     lc = 0.1
 
     gmsh.model.geo.add_point(0, 0, 0, lc, 1)
@@ -45,14 +43,21 @@ for coefficient, name in zip([1, 2, 4], ["rectangle-coarse-elements", "rectangle
     gmsh.model.mesh.generate(2)
 
     old_tags, new_tags = gmsh.model.mesh.computeRenumbering(method="RCMK", elementTags=[])
-    print("old_tags:", old_tags[:10])
-    print("new_tags:", new_tags[:10])
-
     gmsh.model.mesh.renumberNodes(oldTags=old_tags, newTags=new_tags)
 
-    # gmsh.option.setNumber("Mesh.PreserveNumberingMsh2", 0)
-    # gmsh.option.setNumber("Mesh.MshFileVersion", 2.2)
-    gmsh.write(f"{name}.msh")
-    # gmsh.fltk.run()
+
+if __name__ == "__main__":
+    # One gmsh session for all variants; the model is cleared between them
+    gmsh.initialize()
+    gmsh.option.set_number("Mesh.Binary", 1)
+    gmsh.option.set_number("Mesh.MshFileVersion", 4.1)
+
+    for coefficient, name in zip([1, 2, 4], ["rectangle-coarse-elements", "rectangle-middle-elements", "rectangle-fine-elements"]):
+        gmsh.model.add(f"{name}")
+        build(coefficient)
+        gmsh.write(f"{name}.msh")
+        if os.environ.get("GMSH_GUI"):
+            gmsh.fltk.run()
+        gmsh.clear()
 
     gmsh.finalize()
@@ -0,0 +1,33 @@
+"""Helpers shared by the gmsh mesh generation scripts in this directory."""
+import os
+import shutil
+import tempfile
+
+import gmsh
+import numpy as np
+
+
+def renumber_elements_by_nodes() -> None:
+    """Renumber all elements so that their order follows the (renumbered) nodes."""
+    _, element_tags_list, node_tags_list = gmsh.model.mesh.getElements()
+    old_tags = np.concatenate(element_tags_list)
+    first_nodes = np.concatenate([
+        node_tags.reshape(element_tags.size, -1).min(axis=1)
+        for element_tags, node_tags in zip(element_tags_list, node_tags_list, strict=True)
+    ])
+    order = np.argsort(first_nodes, kind="stable")
+    new_tags = np.empty_like(old_tags)
+    new_tags[order] = np.arange(1, old_tags.size + 1, dtype=old_tags.dtype)
+    gmsh.model.mesh.renumberElements(oldTags=old_tags, newTags=new_tags)
+
+
+def write_mesh(filename: str) -> None:
+    """Write the mesh to a local temporary file and copy it to `filename` in large chunks."""
+    with tempfile.NamedTemporaryFile(suffix=".msh", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        gmsh.write(tmp_path)
+        with open(tmp_path, "rb") as src, open(filename, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=16 * 1024 * 1024)
+    finally:
+        os.remove(tmp_path)
@@ -1,30 +1,37 @@
-import gmsh
-
-import itertools as it
+import functools
+import os
 
+import gmsh
 import numpy as np
 import numpy.typing as npt
+from mesh_helpers import renumber_elements_by_nodes
 
-def get_coordinates_on_circle(center: tuple[float, float], radius: float, num_points: int) -> npt.NDArray[np.float64]:
+@functools.lru_cache(maxsize=32)
+def _unit_circle(num_points: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
     angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
-    x = center[0] + radius * np.cos(angles)
-    y = center[1] + radius * np.sin(angles)
+    return np.cos(angles), np.sin(angles)
+
+def get_coordinates_on_circle(center: tuple[float, float], radius: float, num_points: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    cos_arr, sin_arr = _unit_circle(num_points)
+    x = center[0] + radius * cos_arr
+    y = center[1] + radius * sin_arr
     z = np.zeros(num_points)
 
-    return np.vstack((x, y, z)).T
+    return x, y, z
 
 def add_circle(center: tuple[float, float], radius: float, num_points: int) -> tuple[int, list[int]]:
-    points = get_coordinates_on_circle(center, radius, num_points)
-    center_point_tag = gmsh.model.geo.add_point(center[0], center[1], 0.0)
-    point_tags = []
-    for x, y, z in points:
-        tag = gmsh.model.geo.add_point(x, y, z)
-        point_tags.append(tag)
-
-    circle_arc_tags = []
-    for start_tag, end_tag in zip(point_tags, point_tags[1:] + [point_tags[0]]):
-        arc_tag = gmsh.model.geo.add_circle_arc(start_tag, center_point_tag, end_tag)
-        circle_arc_tags.append(arc_tag)
+    xs, ys, zs = get_coordinates_on_circle(center, radius, num_points)
+    add_point = gmsh.model.geo.add_point
+    add_circle_arc = gmsh.model.geo.add_circle_arc
+    center_point_tag = add_point(center[0], center[1], 0.0)
+    point_tags = np.empty(num_points, dtype=np.int32)
+    for i, (x, y, z) in enumerate(zip(xs.tolist(), ys.tolist(), zs.tolist())):
+        point_tags[i] = add_point(x, y, z)
+    end_tags = np.roll(point_tags, -1)
+    circle_arc_tags = [
+        add_circle_arc(start_tag, center_point_tag, end_tag)
+        for start_tag, end_tag in zip(point_tags.tolist(), end_tags.tolist())
+    ]
 
     curve_loop_tag = gmsh.model.geo.add_curve_loop(circle_arc_tags)
 
@@ -35,49 +42,64 @@ LC = 0.2
 gmsh.initialize()
 gmsh.model.add("Masarykovo nádraží")
 
+add_point = gmsh.model.geo.add_point
+add_line = gmsh.model.geo.add_line
+
 # define points
-pt1 = gmsh.model.geo.add_point(0.01, 0.9, 0.0)
-pt2 = gmsh.model.geo.add_point(0.00, 0.89, 0.0)
-pt3 = gmsh.model.geo.add_point(0.00, 0.71, 0.0)
-pt4 = gmsh.model.geo.add_point(0.10, 0.64, 0.0)
-pt5 = gmsh.model.geo.add_point(0.10, 0.01, 0.0)
-pt6 = gmsh.model.geo.add_point(0.11, 0.0, 0.0)
-pt7 = gmsh.model.geo.add_point(0.83, 0.0, 0.0)
-pt8 = gmsh.model.geo.add_point(0.84, 0.01, 0.0)
-pt9 = gmsh.model.geo.add_point(0.84, 0.64, 0.0)
-pt10 = gmsh.model.geo.add_point(0.94, 0.71, 0.0)
-pt11 = gmsh.model.geo.add_point(0.94, 0.89, 0.0)
-pt12 = gmsh.model.geo.add_point(0.93, 0.90, 0.0)
-pt13 = gmsh.model.geo.add_point(0.73, 0.90, 0.0)
-pt14 = gmsh.model.geo.add_point(0.72, 0.89, 0.0)
-pt15 = gmsh.model.geo.add_point(0.72, 0.14, 0.0)
-pt16 = gmsh.model.geo.add_point(0.70, 0.12, 0.0)
-pt17 = gmsh.model.geo.add_point(0.24, 0.12, 0.0)
-pt18 = gmsh.model.geo.add_point(0.22, 0.14, 0.0)
-pt19 = gmsh.model.geo.add_point(0.22, 0.89, 0.0)
-pt20 = gmsh.model.geo.add_point(0.21, 0.9, 0.0)
-
-line1 = gmsh.model.geo.add_line(pt1, pt2)
-line2 = gmsh.model.geo.add_line(pt2, pt3)
-line3 = gmsh.model.geo.add_line(pt3, pt4)
-line4 = gmsh.model.geo.add_line(pt4, pt5)
-line5 = gmsh.model.geo.add_line(pt5, pt6)
-line6 = gmsh.model.geo.add_line(pt6, pt7)
-line7 = gmsh.model.geo.add_line(pt7, pt8)
-line8 = gmsh.model.geo.add_line(pt8, pt9)
-line9 = gmsh.model.geo.add_line(pt9, pt10)
-line10 = gmsh.model.geo.add_line(pt10, pt11)
-line11 = gmsh.model.geo.add_line(pt11, pt12)
-line12 = gmsh.model.geo.add_line(pt12, pt13)
-line13 = gmsh.model.geo.add_line(pt13, pt14)
-line14 = gmsh.model.geo.add_line(pt14, pt15)
-line15 = gmsh.model.geo.add_line(pt15, pt16)
-line16 = gmsh.model.geo.add_line(pt16, pt17)
-line17 = gmsh.model.geo.add_line(pt17, pt18)
-line18 = gmsh.model.geo.add_line(pt18, pt19)
-line19 = gmsh.model.geo.add_line(pt19, pt20)
-line20 = gmsh.model.geo.add_line(pt20, pt1)
-line21 = gmsh.model.geo.add_line(pt13, pt20)
+point_coordinates = [
+    (0.01, 0.9),
+    (0.00, 0.89),
+    (0.00, 0.71),
+    (0.10, 0.64),
+    (0.10, 0.01),
+    (0.11, 0.0),
+    (0.83, 0.0),
+    (0.84, 0.01),
+    (0.84, 0.64),
+    (0.94, 0.71),
+    (0.94, 0.89),
+    (0.93, 0.90),
+    (0.73, 0.90),
+    (0.72, 0.89),
+    (0.72, 0.14),
+    (0.70, 0.12),
+    (0.24, 0.12),
+    (0.22, 0.14),
+    (0.22, 0.89),
+    (0.21, 0.9),
+]
+(
+    pt1, pt2, pt3, pt4, pt5, pt6, pt7, pt8, pt9, pt10, pt11, pt12, pt13, pt14, pt15, pt16, pt17,
+    pt18, pt19, pt20,
+) = [add_point(x, y, 0.0) for x, y in point_coordinates]
+
+line_endpoints = [
+    (pt1, pt2),
+    (pt2, pt3),
+    (pt3, pt4),
+    (pt4, pt5),
+    (pt5, pt6),
+    (pt6, pt7),
+    (pt7, pt8),
+    (pt8, pt9),
+    (pt9, pt10),
+    (pt10, pt11),
+    (pt11, pt12),
+    (pt12, pt13),
+    (pt13, pt14),
+    (pt14, pt15),
+    (pt15, pt16),
+    (pt16, pt17),
+    (pt17, pt18),
+    (pt18, pt19),
+    (pt19, pt20),
+    (pt20, pt1),
+    (pt13, pt20),
+]
+(
+    line1, line2, line3, line4, line5, line6, line7, line8, line9, line10, line11, line12, line13,
+    line14, line15, line16, line17, line18, line19, line20, line21,
+) = [add_line(start, end) for start, end in line_endpoints]
 
 uhpc_curve_loop = gmsh.model.geo.add_curve_loop(
     [
@@ -169,18 +191,18 @@ gmsh.option.set_number("Mesh.CharacteristicLengthMax", LC)
 
 gmsh.model.mesh.generate(2)
 
-types1, tags1, _ = gmsh.model.mesh.getElements(1)   # curves (1D)
-types2, tags2, _ = gmsh.model.mesh.getElements(2)   # surface (2D)
-
-element_tags = list(it.chain.from_iterable(tags1 + tags2))
+_, tags, _ = gmsh.model.mesh.getElements()   # all dimensions at once
 
-old_tags, new_tags = gmsh.model.mesh.computeRenumbering(method="RCMK", elementTags=element_tags)
-print("old_tags:", old_tags[:10])
-print("new_tags:", new_tags[:10])
+element_tags = np.concatenate(tags) if tags else np.empty(0, dtype=np.uint64)
 
+old_tags, new_tags = gmsh.model.mesh.computeRenumbering(method="Hilbert", elementTags=element_tags)
 gmsh.model.mesh.renumberNodes(oldTags=old_tags, newTags=new_tags)
+renumber_elements_by_nodes()
 
+gmsh.option.set_number("Mesh.Binary", 1)
+gmsh.option.set_number("Mesh.MshFileVersion", 4.1)
 gmsh.write("masaryk.msh")
 
-gmsh.fltk.run()
+if os.environ.get("GMSH_GUI"):
+    gmsh.fltk.run()
 gmsh.finalize()
@@ -1,36 +1,38 @@
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import gmsh
-import itertools as it
-
 import numpy as np
+from mesh_helpers import renumber_elements_by_nodes
+from mesh_helpers import write_mesh
 
 if TYPE_CHECKING:
     import numpy.typing as npt
 
 
-def get_coordinates_on_circle(radius: float, num_points: int) -> npt.NDArray[np.float64]:
+def get_coordinates_on_circle(radius: float, num_points: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
     angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
     x = radius * np.cos(angles)
     y = radius * np.sin(angles)
     z = np.zeros(num_points)
 
-    return np.vstack((x, y, z)).T
+    return x, y, z
 
 def add_circle(radius: float, num_points: int, lc: float) -> tuple[int, list[int]]:
-    points = get_coordinates_on_circle(radius, num_points)
-    center_point_tag = gmsh.model.geo.add_point(0.0, 0.0, 0.0, lc)
-    point_tags = []
-    for x, y, z in points:
-        tag = gmsh.model.geo.add_point(x, y, z, lc)
-        point_tags.append(tag)
-
-    circle_arc_tags = []
-    for start_tag, end_tag in zip(point_tags, point_tags[1:] + [point_tags[0]]):
-        arc_tag = gmsh.model.geo.add_circle_arc(start_tag, center_point_tag, end_tag)
-        circle_arc_tags.append(arc_tag)
+    xs, ys, zs = get_coordinates_on_circle(radius, num_points)
+    add_point = gmsh.model.geo.add_point
+    add_circle_arc = gmsh.model.geo.add_circle_arc
+    center_point_tag = add_point(0.0, 0.0, 0.0, lc)
+    point_tags = np.empty(num_points, dtype=np.int32)
+    for i, (x, y, z) in enumerate(zip(xs.tolist(), ys.tolist(), zs.tolist())):
+        point_tags[i] = add_point(x, y, z, lc)
+    end_tags = np.roll(point_tags, -1)
+    circle_arc_tags = [
+        add_circle_arc(start_tag, center_point_tag, end_tag)
+        for start_tag, end_tag in zip(point_tags.tolist(), end_tags.tolist())
+    ]
 
     curve_loop_tag = gmsh.model.geo.add_curve_loop(circle_arc_tags)
 
@@ -58,17 +60,20 @@ gmsh.model.add_physical_group(1, inner_arc_tags, name="Inner Circle")
 # gmsh.model.add_physical_group(1, outer_arc_tags, name="Outer Circle")
 gmsh.model.add_physical_group(2, [tunnel_wall_tag], name="Domain")
 
-types1, tags1, _ = gmsh.model.mesh.getElements(1)   # curves (1D)
-types2, tags2, _ = gmsh.model.mesh.getElements(2)   # surface (2D)
+_, tags, _ = gmsh.model.mesh.getElements()   # all dimensions at once
 
-element_tags = list(it.chain.from_iterable(tags1 + tags2))
+element_tags = np.concatenate(tags) if tags else np.empty(0, dtype=np.uint64)
 
-old_tags, new_tags = gmsh.model.mesh.computeRenumbering(method="RCMK", elementTags=element_tags)
+old_tags, new_tags = gmsh.model.mesh.computeRenumbering(method="Hilbert", elementTags=element_tags)
 gmsh.model.mesh.renumberNodes(oldTags=old_tags, newTags=new_tags)
+renumber_elements_by_nodes()
 
-gmsh.write("TBM_tunnel.msh")
+gmsh.option.set_number("Mesh.Binary", 1)
+gmsh.option.set_number("Mesh.MshFileVersion", 4.1)
+write_mesh("TBM_tunnel.msh")
 
-gmsh.fltk.run()
+if os.environ.get("GMSH_GUI"):
+    gmsh.fltk.run()
 gmsh.finalize()
 
 
@@ -1,38 +1,41 @@
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import gmsh
-import itertools as it
-
 import numpy as np
+from mesh_helpers import renumber_elements_by_nodes
+from mesh_helpers import write_mesh
 
-from temperatureanalysis.app.ui.panels.geometry_editors.math_utils import line_circle_intersection
+from temperatureanalysis.model.geometry_primitives import Circle, Point, Vector
+from temperatureanalysis.model.geometry_utils import line_circle_intersection
 
 if TYPE_CHECKING:
     import numpy.typing as npt
 
 
-def get_coordinates_on_circle(center: tuple[float, float], radius: float, num_points: int) -> npt.NDArray[np.float64]:
+def get_coordinates_on_circle(center: tuple[float, float], radius: float, num_points: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
     angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
     x = center[0] + radius * np.cos(angles)
     y = center[1] + radius * np.sin(angles)
     z = np.zeros(num_points)
 
-    return np.vstack((x, y, z)).T
+    return x, y, z
 
 def add_circle(center: tuple[float, float], radius: float, num_points: int, lc: float) -> tuple[int, list[int]]:
-    points = get_coordinates_on_circle(center, radius, num_points)
-    center_point_tag = gmsh.model.geo.add_point(center[0], center[1], 0.0, lc)
-    point_tags = []
-    for x, y, z in points:
-        tag = gmsh.model.geo.add_point(x, y, z, lc)
-        point_tags.append(tag)
-
-    circle_arc_tags = []
-    for start_tag, end_tag in zip(point_tags, point_tags[1:] + [point_tags[0]]):
-        arc_tag = gmsh.model.geo.add_circle_arc(start_tag, center_point_tag, end_tag)
-        circle_arc_tags.append(arc_tag)
+    xs, ys, zs = get_coordinates_on_circle(center, radius, num_points)
+    add_point = gmsh.model.geo.add_point
+    add_circle_arc = gmsh.model.geo.add_circle_arc
+    center_point_tag = add_point(center[0], center[1], 0.0, lc)
+    point_tags = np.empty(num_points, dtype=np.int32)
+    for i, (x, y, z) in enumerate(zip(xs.tolist(), ys.tolist(), zs.tolist())):
+        point_tags[i] = add_point(x, y, z, lc)
+    end_tags = np.roll(point_tags, -1)
+    circle_arc_tags = [
+        add_circle_arc(start_tag, center_point_tag, end_tag)
+        for start_tag, end_tag in zip(point_tags.tolist(), end_tags.tolist())
+    ]
 
     curve_loop_tag = gmsh.model.geo.add_curve_loop(circle_arc_tags)
 
@@ -65,17 +68,22 @@ p5 = (+tw / 2, rh)
 p_left = (-tw / 2 - 2 * r_inner, lh + 2 * ls * r_inner)
 p_right = (+tw / 2 + 2 * r_inner, rh + 2 * rs * r_inner)
 
-p1 = line_circle_intersection(p2, (p_left[0] - p2[0], p_left[1] - p2[1]), (cx, cy), r_inner, as_segment=True)[0]
-p6 = line_circle_intersection(p5, (p_right[0] - p5[0], p_right[1] - p5[1]), (cx, cy), r_inner, as_segment=True)[0]
+inner_circle = Circle(center=Point(cx, cy), radius=r_inner)
+p1 = line_circle_intersection(
+    Point(*p2), Vector(p_left[0] - p2[0], p_left[1] - p2[1]), inner_circle, as_segment=True
+)[0]
+p6 = line_circle_intersection(
+    Point(*p5), Vector(p_right[0] - p5[0], p_right[1] - p5[1]), inner_circle, as_segment=True
+)[0]
 
 # define center of the circle
 center = gmsh.model.geo.add_point(cx, cy, 0, LC)
-p1 = gmsh.model.geo.add_point(p1[0], p1[1], 0, LC)
+p1 = gmsh.model.geo.add_point(p1.x, p1.y, 0, LC)
 p2 = gmsh.model.geo.add_point(p2[0], p2[1], 0, LC)
 p3 = gmsh.model.geo.add_point(p3[0], p3[1], 0, LC)
 p4 = gmsh.model.geo.add_point(p4[0], p4[1], 0, LC)
 p5 = gmsh.model.geo.add_point(p5[0], p5[1], 0, LC)
-p6 = gmsh.model.geo.add_point(p6[0], p6[1], 0, LC)
+p6 = gmsh.model.geo.add_point(p6.x, p6.y, 0, LC)
 
 l1 = gmsh.model.geo.add_line(p2, p1)
 l2 = gmsh.model.geo.add_line(p3, p2)
@@ -112,6 +120,8 @@ tunnel_wall_tag = gmsh.model.geo.add_plane_surface([outer_tag, inner_circle_loop
 invert_tag = gmsh.model.geo.add_plane_surface([invert_circle_loop_tag])
 #
 gmsh.model.geo.synchronize()
+# Mesh the surfaces in parallel on all available cores
+gmsh.option.set_number("General.NumThreads", os.cpu_count() or 4)
 gmsh.model.mesh.generate(2)
 #
 gmsh.model.add_physical_group(1, [
@@ -120,17 +130,20 @@ gmsh.model.add_physical_group(1, [
 # # gmsh.model.add_physical_group(1, outer_arc_tags, name="Outer Circle")
 gmsh.model.add_physical_group(2, [tunnel_wall_tag, invert_tag], name="Domain")
 #
-types1, tags1, _ = gmsh.model.mesh.getElements(1)   # curves (1D)
-types2, tags2, _ = gmsh.model.mesh.getElements(2)   # surface (2D)
+_, tags, _ = gmsh.model.mesh.getElements()   # all dimensions at once
 
-element_tags = list(it.chain.from_iterable(tags1 + tags2))
+element_tags = np.concatenate(tags) if tags else np.empty(0, dtype=np.uint64)
 
-old_tags, new_tags = gmsh.model.mesh.computeRenumbering(method="RCMK", elementTags=element_tags)
+old_tags, new_tags = gmsh.model.mesh.computeRenumbering(method="Hilbert", elementTags=element_tags)
 gmsh.model.mesh.renumberNodes(oldTags=old_tags, newTags=new_tags)
+renumber_elements_by_nodes()
 
-gmsh.write("TBM_tunnel_invert.msh")
+gmsh.option.set_number("Mesh.Binary", 1)
+gmsh.option.set_number("Mesh.MshFileVersion", 4.1)
+write_mesh("TBM_tunnel_invert.msh")
 
-gmsh.fltk.run()
+if os.environ.get("GMSH_GUI"):
+    gmsh.fltk.run()
 gmsh.finalize()
 
 
@@ -1,62 +1,51 @@
+import os
+
 import gmsh
-from math import sin, cos, radians
+import numpy as np
 
 gmsh.initialize()
 LC = 0.1
 
-arc_segments = [
+arc_segments = np.array([
     # radius, angle in degrees
     [3.750, 70.05],
     [8.000, 41.613],
     [1.530, 52.6],
     [9.650, 180-70.05-41.613-52.6]
-]
-
-# Calculate start, end and center points of each arc segment
-arc_points = []
-current_angle = 90.0  # Starting from the top (90 degrees)
-
-tag = 0
-
-prev_end_x = 0
-prev_end_y = 0
-
-for radius, angle in arc_segments:
-    start_angle = current_angle
-    end_angle = current_angle + angle
-
-    center_x = prev_end_x - radius * cos(radians(start_angle))
-    center_y = prev_end_y - radius * sin(radians(start_angle))
-    center_point = gmsh.model.geo.add_point(center_x, center_y, 0, LC, tag)
-    tag += 1
-
-    start_x = center_x + radius * cos(radians(start_angle))
-    start_y = center_y + radius * sin(radians(start_angle))
-    start_point = gmsh.model.geo.add_point(start_x, start_y, 0, LC, tag)
-    tag += 1
-
-    end_x = center_x + radius * cos(radians(end_angle))
-    end_y = center_y + radius * sin(radians(end_angle))
-    prev_end_x = end_x
-    prev_end_y = end_y
-    end_point = gmsh.model.geo.add_point(end_x, end_y, 0, LC, tag)
-    tag += 1
-
-    gmsh.model.geo.add_circle_arc(tag-2, tag-3, tag-1)
-
-    current_angle = end_angle
-
-    center_point = gmsh.model.geo.add_point(-center_x, center_y, 0, LC, tag)
-    tag += 1
-
-    start_point = gmsh.model.geo.add_point(-start_x, start_y, 0, LC, tag)
-    tag += 1
-
-    end_point = gmsh.model.geo.add_point(-end_x, end_y, 0, LC, tag)
-    tag += 1
-    gmsh.model.geo.add_circle_arc(tag - 2, tag - 3, tag - 1)
+])
+
+# Calculate start, end and center points of all arc segments at once.
+# The arcs are chained starting from the top (90 degrees), each one starting where the previous one ended.
+radii = arc_segments[:, 0]
+sweeps = np.radians(arc_segments[:, 1])
+end_angles = np.radians(90.0) + np.cumsum(sweeps)
+start_angles = end_angles - sweeps
+
+dx = radii * (np.cos(end_angles) - np.cos(start_angles))
+dy = radii * (np.sin(end_angles) - np.sin(start_angles))
+
+end_x = np.cumsum(dx)
+end_y = np.cumsum(dy)
+start_x = end_x - dx
+start_y = end_y - dy
+center_x = start_x - radii * np.cos(start_angles)
+center_y = start_y - radii * np.sin(start_angles)
+
+add_point = gmsh.model.geo.add_point
+add_circle_arc = gmsh.model.geo.add_circle_arc
+
+# Right half first, then its mirror image about the y-axis
+for cxs, sxs, exs in ((center_x, start_x, end_x), (-center_x, -start_x, -end_x)):
+    for cx, cy, sx, sy, ex, ey in zip(
+        cxs.tolist(), center_y.tolist(), sxs.tolist(), start_y.tolist(), exs.tolist(), end_y.tolist()
+    ):
+        center_point = add_point(cx, cy, 0, LC)
+        start_point = add_point(sx, sy, 0, LC)
+        end_point = add_point(ex, ey, 0, LC)
+        add_circle_arc(start_point, center_point, end_point)
 
 
 gmsh.model.geo.synchronize()
-gmsh.fltk.run()
+if os.environ.get("GMSH_GUI"):
+    gmsh.fltk.run()
 gmsh.finalize()
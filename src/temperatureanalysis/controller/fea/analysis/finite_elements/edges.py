@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from math import hypot
 
 from typing import TYPE_CHECKING
 
 import numpy as np
 
-from temperatureanalysis.controller.fea.analysis.node import Node
+from temperatureanalysis.controller.fea.analysis.node import Node, NodeStore
 import temperatureanalysis.controller.fea.analysis.gauss as gauss
+from temperatureanalysis.controller.fea.analysis.finite_elements import kernels
 from temperatureanalysis.controller.fea.pre.fire_curves import FireCurve
 
 if TYPE_CHECKING:
@@ -21,6 +23,12 @@ EMISSIVITY = 0.7  # Emissivity of the concrete surface
 class LineElement(ABC):
     """Abstract base class for edge elements in finite element analysis."""
 
+    # Element attributes live in slots: they are read in every assembly call
+    __slots__ = (
+        "id", "tag", "nodes", "number_of_integration_points", "number_of_nodes", "global_dofs", "fire_curve",
+        "x", "y", "_coords", "_store", "_gp", "_w",
+    )
+
     def __init__(
         self,
         index: int,
@@ -43,37 +51,31 @@ class LineElement(ABC):
         self.tag = tag
         self.nodes = nodes
         self.number_of_integration_points = number_of_integration_points
+        self.number_of_nodes = len(nodes)
         self.global_dofs: npt.NDArray[np.int64] = np.array([node.uid for node in nodes], dtype=np.int64)
         self.fire_curve = fire_curve
 
+        # Element constants, computed once instead of on every assembly call
+        self._coords: npt.NDArray[np.float64] = np.array([[node.x, node.y] for node in nodes], dtype=np.float64)
+        self.x: npt.NDArray[np.float64] = self._coords[:, 0]
+        self.y: npt.NDArray[np.float64] = self._coords[:, 1]
+        self._store: NodeStore | None = nodes[0].store if nodes else None
+        self._gp, self._w = gauss.gauss_points_weights_edge(n_points=number_of_integration_points)
+
     def __repr__(self) -> str:
         """String representation of the line element."""
         return f"{self.__class__.__name__}(id={self.id}, tag={self.tag}, nodes={self.nodes})"
 
     @property
-    def number_of_nodes(self) -> int:
-        """Return the number of nodes in the edge element."""
-        return len(self.nodes)
-
-    @property
-    def x(self) -> npt.NDArray[np.float64]:
-        """Return the x-coordinates of the nodes in the edge element."""
-        return np.array([node.x for node in self.nodes], dtype=np.float64)
-
-    @property
-    def y(self) -> npt.NDArray[np.float64]:
-        """Return the y-coordinates of the nodes in the edge element."""
-        return np.array([node.y for node in self.nodes], dtype=np.float64)
-
-    @property
-    def jacobian_determinant(self) -> npt.NDArray[np.float64]:
+    def jacobian_determinant(self) -> float:
         """
         Calculate the Jacobian determinant of the edge element.
 
         Returns:
             The Jacobian determinant value.
         """
-        return np.sqrt(np.sum(self.jacobian_matrix ** 2))
+        j_x, j_y = self.jacobian_matrix.tolist()
+        return hypot(j_x, j_y)
 
     @property
     def temperature_at_nodes(self) -> npt.NDArray[np.float64]:
@@ -83,6 +85,8 @@ class LineElement(ABC):
         Returns:
             Array of temperatures at the nodes.
         """
+        if self._store is not None:
+            return self._store.current_temperature[self.global_dofs]
         return np.array([node.current_temperature for node in self.nodes], dtype=np.float64)
 
     @abstractmethod
@@ -119,17 +123,43 @@ class LineElement(ABC):
         Returns:
             Temperature in Kelvin.
         """
-        mid_point = self.shape_functions(iso_coord=0.0) @ np.array([self.x, self.y]).T
-        return self.fire_curve.get_temperature(time=time, position=mid_point)
+        return self.fire_curve.get_temperature(time=time, position=self._mid_point)
+
+    @property
+    def _mid_point(self) -> npt.NDArray[np.float64]:
+        """Coordinates of the element mid-point (iso_coord = 0), where the fire temperature is taken."""
+        return self.shape_functions(iso_coord=0.0) @ self._coords
 
     def get_integration_scheme(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         """
-        Get the integration scheme for the line element.
+        Return cached Gauss points and weights for the line element.
 
         Returns:
             A tuple containing the integration points and weights.
         """
-        return gauss.gauss_points_weights_edge(n_points=self.number_of_integration_points)
+        return self._gp, self._w
+
+    @property
+    def _N(self) -> npt.NDArray[np.float64]:
+        """Shape functions at the integration points, shape (n_gp, n_nodes)."""
+        return self.shape_functions_batch(self._gp)
+
+    @property
+    def _NN(self) -> npt.NDArray[np.float64]:
+        """Outer products of the shape functions at the integration points, shape (n_gp, n_nodes, n_nodes)."""
+        return np.einsum("gi,gj->gij", self._N, self._N)
+
+    def shape_functions_batch(self, iso_coords: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Calculate the shape functions for the line element at several local coordinates at once.
+
+        Args:
+            iso_coords: Local coordinates in the range [-1, 1], shape (n_gp,).
+
+        Returns:
+            Shape function values, shape (n_gp, n_nodes).
+        """
+        return np.stack([self.shape_functions(iso_coord=gp) for gp in iso_coords])
 
     def get_load_vector(self, temperature: float) -> npt.NDArray[np.float64]:
         """
@@ -145,26 +175,19 @@ class LineElement(ABC):
         sigma = STEFAN_BOLTZMANN  # Stefan-Boltzmann constant
         e = EMISSIVITY
 
-        f_e = np.zeros(self.number_of_nodes, dtype=np.float64)
-
-        gauss_points, weights = self.get_integration_scheme()
-
-        det_j = self.jacobian_determinant
+        n_e = self._N  # (n_gp, n_nodes)
 
         t_f = temperature # fire temperature
 
-        for gp_i, w_i in zip(gauss_points, weights):
-            # Calculate the shape functions at the integration point
-            n_ei = self.shape_functions(iso_coord=gp_i)
-
-            # Calculate the temperature at the integration point
-            # t_i = np.sum(n_ei * temperature_at_nodes)
-            t_i = n_ei @ self.temperature_at_nodes
+        # Temperatures at all integration points at once
+        t = n_e @ self.temperature_at_nodes  # (n_gp,)
 
-            # Calculate the contribution to the load vector
-            f_e += n_ei.T * (alpha * (t_i - t_f) + e * sigma * (t_i ** 4 - t_f ** 4)) * w_i * det_j
+        # T⁴ - T_f⁴ factored to reuse the squares
+        t2 = t * t
+        t_f2 = t_f * t_f
+        flux = alpha * (t - t_f) + e * sigma * ((t2 - t_f2) * (t2 + t_f2))
 
-        return f_e
+        return (self._w * flux * self.jacobian_determinant) @ n_e
 
     def get_load_vector_tangent(self) -> npt.NDArray[np.float64]:
         """
@@ -178,32 +201,20 @@ class LineElement(ABC):
         sigma = STEFAN_BOLTZMANN  # Stefan-Boltzmann constant
         e = EMISSIVITY  # Emissivity of the concrete surface
 
-        df_dx_e = np.zeros((self.number_of_nodes, self.number_of_nodes), dtype=np.float64)
-
-        gauss_points, weights = self.get_integration_scheme()
-
-        det_j = self.jacobian_determinant
-
-        for gp_i, w_i in zip(gauss_points, weights):
-            # Calculate the shape functions at the integration point
-            n_ei = self.shape_functions(iso_coord=gp_i)
+        # Temperatures at all integration points at once
+        t = self._N @ self.temperature_at_nodes  # (n_gp,)
 
-            # Calculate the temperature at the integration point
-            t_i = n_ei @ self.temperature_at_nodes
+        mat_factor = alpha + 4 * e * sigma * (t * t * t)
 
-            outer_nn = np.outer(n_ei, n_ei)
-
-            mat_factor = alpha + 4 * e * sigma * t_i ** 3
-
-            # Calculate the contribution to the load vector
-            df_dx_e += outer_nn * mat_factor * w_i * det_j
-
-        return df_dx_e
+        return np.tensordot(self._w * mat_factor * self.jacobian_determinant, self._NN, axes=1)
 
 
 class Line2(LineElement):
     """Linear line element with two nodes."""
 
+    # Element constants, precomputed in __init__ and read as plain attributes
+    __slots__ = ("jacobian_matrix", "jacobian_determinant", "_mid_point")
+
     def __init__(self, index: int, tag: int, nodes: list[Node], fire_curve: FireCurve) -> None:
         """
         Initialize the linear line element.
@@ -215,20 +226,41 @@ class Line2(LineElement):
         """
         super().__init__(index=index, tag=tag, nodes=nodes, number_of_integration_points=3, fire_curve=fire_curve)
 
+        (x1, y1), (x2, y2) = self._coords.tolist()
+        # Jacobian of a straight edge, dX/dξ = [-1/2, 1/2] @ coords
+        # TODO: Check if this is correct for edges, as it might differ from area elements
+        self.jacobian_matrix: npt.NDArray[np.float64] = np.array([0.5 * (x2 - x1), 0.5 * (y2 - y1)], dtype=np.float64)
+        # Half of the edge length
+        self.jacobian_determinant: float = 0.5 * hypot(x2 - x1, y2 - y1)
+        # Fire temperature is taken at the mid-point of the edge
+        self._mid_point: npt.NDArray[np.float64] = np.array([0.5 * (x1 + x2), 0.5 * (y1 + y2)], dtype=np.float64)
+
     def shape_functions(self, iso_coord: float) -> npt.NDArray[np.float64]:
         """Shape functions for a linear line element."""
         return np.array([(1 - iso_coord) / 2, (1 + iso_coord) / 2], dtype=np.float64)
 
-    @property
-    def jacobian_matrix(self) -> npt.NDArray[np.float64]:
-        """Jacobian for a linear line element."""
-        b = np.array([-1/2, 1/2], dtype=np.float64)  # Derivative of shape functions w.r.t. local coordinate
-        return b @ np.array([self.x, self.y]).T  # TODO: Check if this is correct for edges, as it might differ from area elements
+    def shape_functions_batch(self, iso_coords: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Shape functions for a linear line element at several local coordinates, shape (n_gp, 2)."""
+        return np.stack([(1 - iso_coords) / 2, (1 + iso_coords) / 2], axis=1)
+
+    def get_load_vector(self, temperature: float) -> npt.NDArray[np.float64]:
+        """Load vector for a linear line element, evaluated by the JIT kernel."""
+        return kernels.line2_load(
+            self.temperature_at_nodes, self._coords, float(temperature), CONVECTIVE_COEFFICIENT, EMISSIVITY * STEFAN_BOLTZMANN
+        )
+
+    def get_load_vector_tangent(self) -> npt.NDArray[np.float64]:
+        """Load vector tangent for a linear line element, evaluated by the JIT kernel."""
+        return kernels.line2_tangent(
+            self.temperature_at_nodes, self._coords, CONVECTIVE_COEFFICIENT, EMISSIVITY * STEFAN_BOLTZMANN
+        )
 
 
 class Line3(LineElement):
     """Second order line element with three nodes."""
 
+    __slots__ = ()
+
     def __init__(self, index: int, tag: int, nodes: list[Node], fire_curve: FireCurve) -> None:
         """
         Initialize the second order line element.
@@ -250,6 +282,45 @@ class Line3(LineElement):
         raise NotImplementedError("Jacobian for Line3 are not implemented yet.")
 
 
+def line2_loads_batch(
+    edges_coords: npt.NDArray[np.float64],
+    edges_node_ids: npt.NDArray[np.int64],
+    t_nodes: npt.NDArray[np.float64],
+    t_f: float | npt.NDArray[np.float64],
+    out: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]] | None = None,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Evaluate the load vectors and their tangents of many Line2 elements at once.
+
+    Equivalent to calling `Line2.get_load_vector` and `Line2.get_load_vector_tangent`
+    on every element, but done in one JIT kernel running in parallel over the edges.
+
+    Args:
+        edges_coords: Node coordinates of each edge, shape (E, 2, 2).
+        edges_node_ids: Global node indices of each edge, shape (E, 2).
+        t_nodes: Global vector of current node temperatures in Kelvin.
+        t_f: Fire temperature in Kelvin, scalar or shape (E,).
+        out: Optional preallocated (f_e, df_e) buffers to write the results into.
+
+    Returns:
+        f_e: Load vector of each edge, shape (E, 2).
+        df_e: Load vector tangent of each edge, shape (E, 2, 2).
+    """
+    n_edges = edges_coords.shape[0]
+    t_f = np.broadcast_to(np.asarray(t_f, dtype=np.float64), (n_edges,))
+    if out is None:
+        out = (np.empty((n_edges, 2), dtype=np.float64), np.empty((n_edges, 2, 2), dtype=np.float64))
+    return kernels.line2_loads_batch_kernel(
+        np.ascontiguousarray(edges_coords, dtype=np.float64),
+        np.ascontiguousarray(edges_node_ids, dtype=np.int64),
+        np.ascontiguousarray(t_nodes, dtype=np.float64),
+        np.ascontiguousarray(t_f),
+        CONVECTIVE_COEFFICIENT,
+        EMISSIVITY * STEFAN_BOLTZMANN,
+        *out,
+    )
+
+
 # if __name__ == "__main__":
     # # Example usage of a Line2 element
     # node1 = Node(index=1, coords=[0.0, 0.0])
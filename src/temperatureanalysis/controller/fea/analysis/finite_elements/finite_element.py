@@ -11,7 +11,7 @@ import temperatureanalysis.controller.fea.analysis.gauss as gauss
 if TYPE_CHECKING:
     import numpy.typing as npt
     from temperatureanalysis.controller.fea.pre.material import Material
-    from temperatureanalysis.controller.fea.analysis.node import Node
+    from temperatureanalysis.controller.fea.analysis.node import Node, NodeStore
 
 
 class FiniteElement(ABC):
@@ -19,6 +19,9 @@ class FiniteElement(ABC):
     Abstract base class for finite elements in temperature analysis.
     """
 
+    # Element attributes live in slots: they are read in every assembly call
+    __slots__ = ("id", "tag", "material", "nodes", "n_integration_points", "number_of_nodes", "global_dofs", "x", "y", "_store")
+
     def __init__(
         self,
         index: int,
@@ -42,7 +45,9 @@ class FiniteElement(ABC):
         self.material = material
         self.nodes = nodes
         self.n_integration_points = n_integration_points
+        self.number_of_nodes = len(nodes)
         self.global_dofs: npt.NDArray[np.int64] = np.array([node.uid for node in nodes], dtype=np.int64)
+        self._store: NodeStore | None = nodes[0].store if nodes else None
 
         self.x = np.array([node.coords[0] for node in nodes], dtype=np.float64)
         self.y = np.array([node.coords[1] for node in nodes], dtype=np.float64)
@@ -51,11 +56,6 @@ class FiniteElement(ABC):
         """String representation of the finite element."""
         return f"{self.__class__.__name__}(id={self.id}, tag='{self.tag}', material={self.material.name})"
 
-    @property
-    def number_of_nodes(self) -> int:
-        """Number of nodes in the finite element."""
-        return len(self.nodes)
-
     @staticmethod
     @abstractmethod
     def shape_functions(iso_coords: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
@@ -85,6 +85,8 @@ class FiniteElement(ABC):
         Returns:
             Array of temperatures at the nodes.
         """
+        if self._store is not None:
+            return self._store.current_temperature[self.global_dofs]
         return np.array([node.current_temperature for node in self.nodes], dtype=np.float64)
 
     @abstractmethod
@@ -118,27 +120,22 @@ class FiniteElement(ABC):
         Returns:
             Conductivity matrix for the element.
         """
-        k_e = np.zeros((self.number_of_nodes, self.number_of_nodes), dtype=np.float64)
-
         gauss_points, weights = self.get_integration_scheme()
 
         b_e = self.b_matrix
         det_j = self.jacobian_determinant
 
-        for gp_i, w_i in zip(gauss_points, weights):
-            # Calculate the shape functions at the integration point
-            n_ei = self.shape_functions(iso_coords=gp_i)
+        # Shape functions at all integration points, (n_gp, n_nodes)
+        n_e = np.array([self.shape_functions(iso_coords=gp_i) for gp_i in gauss_points], dtype=np.float64)
+        n_e = n_e.reshape(len(gauss_points), -1)
 
-            # Calculate the temperature at the integration point
-            t_i = n_ei @ self.temperature_at_nodes
-            # t_i = np.sum(n_ei * temperature_at_nodes)
+        # Calculate the temperature at the integration points
+        t = n_e @ self.temperature_at_nodes
 
-            # Calculate the thermal conductivity at the integration point
-            lambda_ci = self.material.thermal_conductivity(temperature_K=t_i)
+        # Calculate the thermal conductivity at all integration points in one call
+        lambda_c = np.asarray(self.material.thermal_conductivity(temperature_K=t), dtype=np.float64)
 
-            k_e += b_e.T @ b_e * det_j * lambda_ci * w_i
-
-        return k_e
+        return b_e.T @ b_e * det_j * float(np.dot(lambda_c, weights))
 
     def get_capacity_matrix(self) -> npt.NDArray[np.float64]:
         """
@@ -147,26 +144,19 @@ class FiniteElement(ABC):
         Returns:
             Capacity matrix of the element.
         """
-        c_e = np.zeros((self.number_of_nodes, self.number_of_nodes), dtype=np.float64)
-
         gauss_points, weights = gauss.gauss_points_weights_triangle(self.n_integration_points)
 
         det_j = self.jacobian_determinant
 
-        for gp_i, w_i in zip(gauss_points, weights):
-            # Calculate the shape functions at the integration point
-            n_ei = self.shape_functions(iso_coords=gp_i)
-
-            # Calculate the temperature at the integration point
-            # t_i = np.sum(n_ei * t_at_nodes)
-            t_i = n_ei @ self.temperature_at_nodes
-
-            # Calculate the density and specific heat capacity at the integration point
-            rho_ci = self.material.density(temperature_K=t_i)
-            c_pi = self.material.specific_heat_capacity(temperature_K=t_i)
+        # Shape functions at all integration points, (n_gp, n_nodes)
+        n_e = np.array([self.shape_functions(iso_coords=gp_i) for gp_i in gauss_points], dtype=np.float64)
+        n_e = n_e.reshape(len(gauss_points), -1)
 
-            # Calculate the contribution to the capacity matrix
-            c_e += det_j * n_ei.T @ n_ei * rho_ci * c_pi * w_i
+        # Calculate the temperature at the integration points
+        t = n_e @ self.temperature_at_nodes
 
-        return c_e
+        # Calculate the density and specific heat capacity at all integration points in one call
+        rho_c = np.asarray(self.material.volumetric_heat_capacity(temperature_K=t), dtype=np.float64)
 
+        # C = ∑ N_gᵀ N_g * ρc(T_g) * |detJ| * w_g, without forming each outer product separately
+        return np.einsum("g,gi,gj->ij", det_j * rho_c * weights, n_e, n_e)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from math import hypot, sqrt
+
+import numpy as np
+import numpy.typing as npt
+import numba as nb
+
+# ---- JIT’d element kernels ----
+# Material laws and fire curves stay in Python; their values at the integration
+# points are evaluated by the caller and passed in as plain arrays.
+
+# 3-point Gauss rule on [-1, +1] used by Line2
+LINE2_GP = (-sqrt(3.0 / 5.0), 0.0, sqrt(3.0 / 5.0))
+LINE2_W = (5.0 / 9.0, 8.0 / 9.0, 5.0 / 9.0)
+
+# Line2 shape functions N1 = (1 - ξ) / 2 and N2 = (1 + ξ) / 2 at those points
+LINE2_N0 = tuple(0.5 * (1.0 - gp) for gp in LINE2_GP)
+LINE2_N1 = tuple(0.5 * (1.0 + gp) for gp in LINE2_GP)
+
+
+@nb.njit(cache=True, fastmath=True, inline="always")
+def _line2_load_terms(
+    t0: float,
+    t1: float,
+    det_j: float,
+    t_f: float,
+    alpha: float,
+    e_sigma: float
+) -> tuple[float, float]:
+    """Load vector entries (f0, f1) of a Line2 element with node temperatures t0, t1."""
+    t_f2 = t_f * t_f
+    f0 = 0.0
+    f1 = 0.0
+    for g in range(3):
+        n0 = LINE2_N0[g]
+        n1 = LINE2_N1[g]
+        t = n0 * t0 + n1 * t1
+        t2 = t * t
+        # T⁴ - T_f⁴ factored to reuse the squares
+        q = (alpha * (t - t_f) + e_sigma * ((t2 - t_f2) * (t2 + t_f2))) * LINE2_W[g] * det_j
+        f0 += n0 * q
+        f1 += n1 * q
+    return f0, f1
+
+
+@nb.njit(cache=True, fastmath=True, inline="always")
+def _line2_tangent_terms(
+    t0: float,
+    t1: float,
+    det_j: float,
+    alpha: float,
+    e_sigma: float
+) -> tuple[float, float, float]:
+    """Tangent entries (k00, k01, k11) of a Line2 element with node temperatures t0, t1; k10 = k01."""
+    k00 = 0.0
+    k01 = 0.0
+    k11 = 0.0
+    for g in range(3):
+        n0 = LINE2_N0[g]
+        n1 = LINE2_N1[g]
+        t = n0 * t0 + n1 * t1
+        m = (alpha + 4.0 * e_sigma * t * t * t) * LINE2_W[g] * det_j
+        k00 += n0 * n0 * m
+        k01 += n0 * n1 * m
+        k11 += n1 * n1 * m
+    return k00, k01, k11
+
+
+@nb.njit(cache=True, fastmath=True)
+def line2_load(
+    t_nodes: npt.NDArray[np.float64],
+    coords: npt.NDArray[np.float64],
+    t_f: float,
+    alpha: float,
+    e_sigma: float
+) -> npt.NDArray[np.float64]:
+    """
+    Load vector of a single Line2 element.
+
+    Args:
+        t_nodes: Node temperatures in Kelvin, shape (2,).
+        coords:  Node coordinates, shape (2, 2).
+        t_f:     Fire temperature in Kelvin.
+        alpha:   Convective heat transfer coefficient.
+        e_sigma: Emissivity times the Stefan-Boltzmann constant.
+
+    Returns:
+        Load vector, shape (2,).
+    """
+    det_j = 0.5 * hypot(coords[1, 0] - coords[0, 0], coords[1, 1] - coords[0, 1])
+    f0, f1 = _line2_load_terms(t_nodes[0], t_nodes[1], det_j, t_f, alpha, e_sigma)
+
+    f_e = np.empty(2, dtype=np.float64)
+    f_e[0] = f0
+    f_e[1] = f1
+    return f_e
+
+
+@nb.njit(cache=True, fastmath=True)
+def line2_tangent(
+    t_nodes: npt.NDArray[np.float64],
+    coords: npt.NDArray[np.float64],
+    alpha: float,
+    e_sigma: float
+) -> npt.NDArray[np.float64]:
+    """
+    Load vector tangent (df/dT) of a single Line2 element.
+
+    Args:
+        t_nodes: Node temperatures in Kelvin, shape (2,).
+        coords:  Node coordinates, shape (2, 2).
+        alpha:   Convective heat transfer coefficient.
+        e_sigma: Emissivity times the Stefan-Boltzmann constant.
+
+    Returns:
+        Tangent matrix, shape (2, 2).
+    """
+    det_j = 0.5 * hypot(coords[1, 0] - coords[0, 0], coords[1, 1] - coords[0, 1])
+    k00, k01, k11 = _line2_tangent_terms(t_nodes[0], t_nodes[1], det_j, alpha, e_sigma)
+
+    df_e = np.empty((2, 2), dtype=np.float64)
+    df_e[0, 0] = k00
+    df_e[0, 1] = k01
+    df_e[1, 0] = k01
+    df_e[1, 1] = k11
+    return df_e
+
+
+@nb.njit(cache=True, fastmath=True, parallel=True)
+def line2_loads_batch_kernel(
+    edges_coords: npt.NDArray[np.float64],
+    edges_node_ids: npt.NDArray[np.int64],
+    t_nodes: npt.NDArray[np.float64],
+    t_f: npt.NDArray[np.float64],
+    alpha: float,
+    e_sigma: float,
+    f_e: npt.NDArray[np.float64],
+    df_e: npt.NDArray[np.float64]
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Load vectors and tangents of all Line2 edges, parallel over the edges.
+
+    The results are written straight into the preallocated `f_e` and `df_e`, which are also
+    returned; the loop over the edges allocates nothing.
+
+    Args:
+        edges_coords:   Node coordinates of each edge, shape (E, 2, 2).
+        edges_node_ids: Global node indices of each edge, shape (E, 2).
+        t_nodes:        Global node temperatures in Kelvin, shape (n_nodes,).
+        t_f:            Fire temperature of each edge in Kelvin, shape (E,).
+        alpha:          Convective heat transfer coefficient.
+        e_sigma:        Emissivity times the Stefan-Boltzmann constant.
+        f_e:            Output buffer for the load vectors, shape (E, 2).
+        df_e:           Output buffer for the load vector tangents, shape (E, 2, 2).
+
+    Returns:
+        f_e:  Load vectors, shape (E, 2).
+        df_e: Load vector tangents, shape (E, 2, 2).
+    """
+    n_edges = edges_coords.shape[0]
+    for i in nb.prange(n_edges):
+        t0 = t_nodes[edges_node_ids[i, 0]]
+        t1 = t_nodes[edges_node_ids[i, 1]]
+        det_j = 0.5 * hypot(
+            edges_coords[i, 1, 0] - edges_coords[i, 0, 0], edges_coords[i, 1, 1] - edges_coords[i, 0, 1]
+        )
+
+        f_e[i, 0], f_e[i, 1] = _line2_load_terms(t0, t1, det_j, t_f[i], alpha, e_sigma)
+
+        k00, k01, k11 = _line2_tangent_terms(t0, t1, det_j, alpha, e_sigma)
+        df_e[i, 0, 0] = k00
+        df_e[i, 0, 1] = k01
+        df_e[i, 1, 0] = k01
+        df_e[i, 1, 1] = k11
+    return f_e, df_e
+
+
+@nb.njit(cache=True, fastmath=True)
+def tri3_conductivity(
+    B: npt.NDArray[np.float64],
+    det_j: float,
+    k_gp: npt.NDArray[np.float64],
+    w: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Conductivity matrix of a single Tri3 element, K = Bᵀ B * |detJ| * ∑ k_g w_g.
+
+    Args:
+        B:     Constant gradient matrix, shape (2, 3).
+        det_j: Absolute Jacobian determinant.
+        k_gp:  Thermal conductivity at the integration points, shape (n_gp,).
+        w:     Integration weights, shape (n_gp,).
+
+    Returns:
+        Conductivity matrix, shape (3, 3).
+    """
+    k_w = 0.0
+    for g in range(k_gp.size):
+        k_w += k_gp[g] * w[g]
+    scale = det_j * k_w
+
+    K = np.empty((3, 3), dtype=np.float64)
+    for i in range(3):
+        for j in range(i, 3):
+            v = (B[0, i] * B[0, j] + B[1, i] * B[1, j]) * scale
+            K[i, j] = v
+            K[j, i] = v
+    return K
+
+
+@nb.njit(cache=True, fastmath=True)
+def tri3_capacity(
+    N: npt.NDArray[np.float64],
+    det_j: float,
+    rho_c_gp: npt.NDArray[np.float64],
+    w: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Capacity matrix of a single Tri3 element, C = ∑ N_gᵀ N_g * ρc(T_g) * |detJ| * w_g.
+
+    Args:
+        N:        Shape functions at the integration points, shape (n_gp, 3).
+        det_j:    Absolute Jacobian determinant.
+        rho_c_gp: Volumetric heat capacity at the integration points, shape (n_gp,).
+        w:        Integration weights, shape (n_gp,).
+
+    Returns:
+        Capacity matrix, shape (3, 3).
+    """
+    C = np.zeros((3, 3), dtype=np.float64)
+    for g in range(N.shape[0]):
+        m = rho_c_gp[g] * w[g] * det_j
+        for i in range(3):
+            for j in range(i, 3):
+                C[i, j] += N[g, i] * N[g, j] * m
+    for i in range(3):
+        for j in range(i):
+            C[i, j] = C[j, i]
+    return C
+
+
+@nb.njit(cache=True, fastmath=True, parallel=True)
+def tri3_conductivity_batch_kernel(
+    B: npt.NDArray[np.float64],
+    det_j: npt.NDArray[np.float64],
+    k_w: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Conductivity matrices of many Tri3 elements, parallel over the elements.
+
+    Args:
+        B:     Gradient matrices, shape (E, 2, 3).
+        det_j: Absolute Jacobian determinants, shape (E,).
+        k_w:   Weighted sum of the conductivity at the integration points ∑ k_g w_g, shape (E,).
+        out:   Output buffer, shape (E, 3, 3).
+
+    Returns:
+        out, holding the conductivity matrices.
+    """
+    for e in nb.prange(B.shape[0]):
+        scale = det_j[e] * k_w[e]
+        for i in range(3):
+            for j in range(i, 3):
+                v = (B[e, 0, i] * B[e, 0, j] + B[e, 1, i] * B[e, 1, j]) * scale
+                out[e, i, j] = v
+                out[e, j, i] = v
+    return out
+
+
+@nb.njit(cache=True, fastmath=True, parallel=True)
+def tri3_capacity_batch_kernel(
+    N: npt.NDArray[np.float64],
+    det_j: npt.NDArray[np.float64],
+    rho_c_w: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Capacity matrices of many Tri3 elements, parallel over the elements.
+
+    Args:
+        N:       Shape functions at the integration points, shape (n_gp, 3).
+        det_j:   Absolute Jacobian determinants, shape (E,).
+        rho_c_w: Volumetric heat capacity times the integration weight, shape (E, n_gp).
+        out:     Output buffer, shape (E, 3, 3).
+
+    Returns:
+        out, holding the capacity matrices.
+    """
+    n_gp = N.shape[0]
+    for e in nb.prange(det_j.shape[0]):
+        for i in range(3):
+            for j in range(i, 3):
+                v = 0.0
+                for g in range(n_gp):
+                    v += N[g, i] * N[g, j] * rho_c_w[e, g]
+                v *= det_j[e]
+                out[e, i, j] = v
+                out[e, j, i] = v
+    return out
@@ -7,6 +7,7 @@ import numba as nb
 
 from temperatureanalysis.controller.fea.analysis.finite_elements.finite_element import FiniteElement
 import temperatureanalysis.controller.fea.analysis.gauss as gauss
+from temperatureanalysis.controller.fea.analysis.finite_elements import kernels
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -23,6 +24,10 @@ B_N = np.array([
     [-1.0, 0.0, 1.0],
 ])
 
+# 3-point rule shared by all Tri3 elements; for Tri3 the shape functions at the
+# Gauss points are the Gauss points themselves, so _N_TRI3 doubles as the N table.
+_N_TRI3, _W_TRI3 = gauss.gauss_points_weights_triangle(3)
+
 
 @nb.jit(cache=True, fastmath=True)
 def _inv2(
@@ -81,6 +86,10 @@ class Tri3(FiniteElement):
     """
     Represents a three-node linear triangular finite element (Tri3).
     """
+
+    # Element constants, precomputed in __init__ and read as plain attributes
+    __slots__ = ("area", "jacobian_matrix", "jacobian_determinant", "b_matrix", "_gp", "_w", "_N")
+
     def __init__(
         self,
         index: int,
@@ -105,9 +114,17 @@ class Tri3(FiniteElement):
             n_integration_points=3
         )
 
-        self._B, self._detJ = _tri3_B_and_detJ(self.x, self.y)
-        self._gp, self._w = gauss.gauss_points_weights_triangle(self.n_integration_points)
+        x1, x2, x3 = self.x.tolist()
+        y1, y2, y3 = self.y.tolist()
 
+        # Area from edge vectors relative to the first node, which avoids the cancellation
+        # of the shoelace form for elements far from the origin; abs() for clockwise nodes
+        self.area: float = 0.5 * abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
+        self.jacobian_matrix: npt.NDArray[np.float64] = B_N @ np.array([self.x, self.y]).T
+        # [B] = ∇[N] = [J]⁻¹ [B_N] and |det(J)|, both constant for Tri3
+        self.b_matrix, self.jacobian_determinant = _tri3_B_and_detJ(self.x, self.y)
+        self._gp, self._w = _N_TRI3, _W_TRI3
+        self._N = _N_TRI3  # (n_gp, 3)
 
     @staticmethod
     def shape_functions(iso_coords: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
@@ -123,52 +140,6 @@ class Tri3(FiniteElement):
         # For Tri3, the shape functions are the isoparametric coordinates
         return np.array([iso_coords])
 
-    @property
-    def area(self) -> float:
-        """
-        Calculate the area of the Tri3 element.
-
-        Returns:
-            Area of the triangular element.
-        """
-        x1, y1 = self.nodes[0].coords
-        x2, y2 = self.nodes[1].coords
-        x3, y3 = self.nodes[2].coords
-
-        return 0.5 * (x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2))
-
-    @property
-    def jacobian_matrix(self) -> npt.NDArray[np.float64]:
-        """
-        Calculate the Jacobian matrix for the Tri3 element.
-
-        Returns:
-            Jacobian matrix of the element.
-        """
-        return B_N @ np.array([self.x, self.y]).T
-
-    @property
-    def b_matrix(self) -> npt.NDArray[np.float64]:
-        """
-        Calculate the [B] matrix for the Tri3 element.
-
-        [B] = ∇[N] = [J]⁻¹ [B_N]
-
-        Returns:
-            B matrix of the element.
-        """
-        return np.linalg.inv(self.jacobian_matrix) @ B_N
-
-    @property
-    def jacobian_determinant(self) -> float:
-        """
-        Absolute Jacobian determinant (constant for Tri3).
-
-        Returns:
-            |det(J)|
-        """
-        return self._detJ
-
     def get_integration_scheme(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         """
         Return cached Gauss points and weights for 3-point triangle rule.
@@ -183,7 +154,7 @@ class Tri3(FiniteElement):
         Calculate element conductivity matrix [K] = ∑ (Bᵀ B * k(T_gp) * |detJ| * w).
 
         Uses:
-            - Cached B matrix (constant for Tri3)
+            - Precomputed B matrix (constant for Tri3)
             - Material thermal conductivity at integration points
             - Jacobian determinant (constant for Tri3)
             - Integration weights
@@ -191,27 +162,16 @@ class Tri3(FiniteElement):
         Returns:
             (3, 3) conductivity matrix for Tri3.
         """
-        B = self._B
-        detJ = self._detJ
-        Tn = self.temperature_at_nodes
-
-        # Temperatures at gauss points
-        Tgp = np.empty(3, dtype=np.float64)
-        for i, (gp_i, _) in enumerate(zip(self._gp, self._w)):
-            N = self.shape_functions(gp_i)  # (1, 3)
-            Tgp[i] = float(N @ Tn)  # (1, 3) @ (3,) -> (1,)
+        # Temperatures at all gauss points at once, (n_gp, 3) @ (3,) -> (n_gp,)
+        Tgp = self._N @ self.temperature_at_nodes
 
         # thermal conductivity at the integration points
         if hasattr(self.material, "props_batch"):
             k_gp, _ = self.material.props_batch(Tgp)
         else:
-            k_gp = np.array([self.material.thermal_conductivity(t) for t in Tgp], dtype=np.float64)
-
-        # Accumulate scalar factor ∑ k_i * w_i
-        k_weight_sum = float(np.dot(k_gp, self._w))
+            k_gp = np.asarray(self.material.thermal_conductivity(Tgp), dtype=np.float64)
 
-        BtB = B.T @ B
-        return BtB * (detJ * k_weight_sum)
+        return kernels.tri3_conductivity(self.b_matrix, self.jacobian_determinant, k_gp, self._w)
 
     def get_capacity_matrix(self) -> npt.NDArray[np.float64]:
         """
@@ -225,32 +185,89 @@ class Tri3(FiniteElement):
         Returns:
             (3, 3) capacity matrix for Tri3.
         """
-        detJ = self._detJ
-        Tn = self.temperature_at_nodes
-
-        # Temperatures at gauss points and keep N at each point
-        Tgp = np.empty(3, dtype=np.float64)
-        N_store: list[npt.NDArray[np.float64]] = []
-        for i, (gp_i, _) in enumerate(zip(self._gp, self._w)):
-            N = self.shape_functions(gp_i)  # (1, 3)
-            N_store.append(N)
-            Tgp[i] = float(N @ Tn)  # (1, 3) @ (3,) -> (1,)
+        # Temperatures at all gauss points at once, (n_gp, 3) @ (3,) -> (n_gp,)
+        Tgp = self._N @ self.temperature_at_nodes
 
         if hasattr(self.material, "props_batch"):
             _, rho_c_gp = self.material.props_batch(Tgp)
         else:
-            rho_c_gp = np.array(
-                [self.material.density(t) * self.material.specific_heat_capacity(t) for t in Tgp],
-                dtype=np.float64
-            )
+            rho_c_gp = np.asarray(self.material.volumetric_heat_capacity(Tgp), dtype=np.float64)
+
+        return kernels.tri3_capacity(self._N, self.jacobian_determinant, rho_c_gp, self._w)
+
+
+def tri3_props_at_gauss_points(
+    t_e: npt.NDArray[np.float64],
+    material: Material
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Evaluate conductivity and volumetric heat capacity at the Gauss points of many Tri3 elements.
+
+    Both properties come from one evaluation of the material law, so the conductivity and
+    capacity matrices of the same temperatures should share the result.
+
+    Args:
+        t_e: Node temperatures of each element, shape (E, 3).
+        material: Material shared by all the elements.
+
+    Returns:
+        k_gp:     Thermal conductivity, shape (E, n_gp).
+        rho_c_gp: Volumetric heat capacity, shape (E, n_gp).
+    """
+    t_gp = t_e @ _N_TRI3.T  # (E, n_gp)
+    t_flat = np.ascontiguousarray(t_gp).ravel()
+    if hasattr(material, "props_batch"):
+        k_gp, rho_c_gp = material.props_batch(t_flat)
+    else:
+        k_gp = np.asarray(material.thermal_conductivity(t_flat), dtype=np.float64)
+        rho_c_gp = np.asarray(material.volumetric_heat_capacity(t_flat), dtype=np.float64)
+    return k_gp.reshape(t_gp.shape), rho_c_gp.reshape(t_gp.shape)
+
+
+def tri3_conductivity_batch(
+    B: npt.NDArray[np.float64],
+    det_j: npt.NDArray[np.float64],
+    k_gp: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64] | None = None
+) -> npt.NDArray[np.float64]:
+    """
+    Conductivity matrices of many Tri3 elements.
+
+    Args:
+        B: Gradient matrices, shape (E, 2, 3).
+        det_j: Absolute Jacobian determinants, shape (E,).
+        k_gp: Thermal conductivity at the Gauss points, shape (E, n_gp),
+              see `tri3_props_at_gauss_points`.
+        out: Optional preallocated (E, 3, 3) buffer to write the result into.
+
+    Returns:
+        (E, 3, 3) conductivity matrices.
+    """
+    if out is None:
+        out = np.empty((det_j.size, 3, 3), dtype=np.float64)
+    return kernels.tri3_conductivity_batch_kernel(B, det_j, k_gp @ _W_TRI3, out)
+
 
-        C = np.zeros((3, 3), dtype=np.float64)
-        for i, (_, w_i) in enumerate(zip(self._gp, self._w)):
-            N = N_store[i]
-            C += (N.T @ N) * (rho_c_gp[i] * detJ * w_i)
+def tri3_capacity_batch(
+    det_j: npt.NDArray[np.float64],
+    rho_c_gp: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64] | None = None
+) -> npt.NDArray[np.float64]:
+    """
+    Capacity matrices of many Tri3 elements.
 
-        return C
+    Args:
+        det_j: Absolute Jacobian determinants, shape (E,).
+        rho_c_gp: Volumetric heat capacity at the Gauss points, shape (E, n_gp),
+                  see `tri3_props_at_gauss_points`.
+        out: Optional preallocated (E, 3, 3) buffer to write the result into.
 
+    Returns:
+        (E, 3, 3) capacity matrices.
+    """
+    if out is None:
+        out = np.empty((det_j.size, 3, 3), dtype=np.float64)
+    return kernels.tri3_capacity_batch_kernel(_N_TRI3, det_j, rho_c_gp * _W_TRI3, out)
 
 
 if __name__ == "__main__":
@@ -270,10 +287,8 @@ if __name__ == "__main__":
     tri3_element = Tri3(index=1, tag="Tri3Element", nodes=[node1, node2, node3], material=material)
 
     print(f"{tri3_element.jacobian_matrix=}\n")
-    print(f"{np.linalg.inv(tri3_element.jacobian_matrix)=}\n")
+    print(f"{tri3_element.b_matrix=}\n")
     print(f"{tri3_element.jacobian_determinant=}\n")
-    # print(f"{tri3_element.B=}\n")
-    # print(f"{tri3_element.b_matrix_jacobian()=}")
 
 
     # print(tri3_element)
@@ -10,10 +10,69 @@ if TYPE_CHECKING:
     import numpy.typing as npt
 
 
+def _read_only(
+    points: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64]
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Mark a quadrature rule's arrays read-only, so the shared instances cannot be modified by callers."""
+    points.setflags(write=False)
+    weights.setflags(write=False)
+    return points, weights
+
+
+# Quadrature rules are built once at import and shared by all callers
+_EDGE_RULES: dict[int, tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = {
+    1: _read_only(np.array([0.0]), np.array([2.0])),
+    2: _read_only(np.array([-1/np.sqrt(3), 1/np.sqrt(3)]), np.array([1.0, 1.0])),
+    3: _read_only(np.array([-np.sqrt(3/5), 0.0, np.sqrt(3/5)]), np.array([5/9, 8/9, 5/9])),
+}
+
+_TRIANGLE_RULES: dict[int, tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = {
+    1: _read_only(np.array([[1.0/3.0, 1.0/3.0, 1.0/3.0]]), 0.5 * np.array([1.0])),
+    3: _read_only(
+        np.array([
+            [2.0/3.0, 1.0/6.0, 1.0/6.0],
+            [1.0/6.0, 2.0/3.0, 1.0/6.0],
+            [1.0/6.0, 1.0/6.0, 2.0/3.0]]
+        ),
+        0.5 * np.array([1.0/3.0, 1.0/3.0, 1.0/3.0])
+    ),
+}
+
+_QUADRILATERAL_RULES: dict[int, tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = {
+    1: _read_only(np.array([[0.0, 0.0]]), np.array([4.0])),
+    4: _read_only(
+        np.array([
+            [-1.0/sqrt(3.0), -1.0/sqrt(3.0)],
+            [+1.0/sqrt(3.0), -1.0/sqrt(3.0)],
+            [+1.0/sqrt(3.0), +1.0/sqrt(3.0)],
+            [-1.0/sqrt(3.0), +1.0/sqrt(3.0)],
+        ]),
+        np.array([1.0, 1.0, 1.0, 1.0])
+    ),
+    9: _read_only(
+        np.array([
+            [-sqrt(3.0/5.0), -sqrt(3.0/5.0)],
+            [0.0, -sqrt(3.0/5.0)],
+            [+sqrt(3.0/5.0), -sqrt(3.0/5.0)],
+            [-sqrt(3.0/5.0), 0.0],
+            [0.0, 0.0],
+            [+sqrt(3.0/5.0), 0.0],
+            [-sqrt(3.0/5.0), +sqrt(3.0/5.0)],
+            [0.0, +sqrt(3.0/5.0)],
+            [+sqrt(3.0/5.0), +sqrt(3.0/5.0)],
+        ]),
+        np.array([25/81, 40/81, 25/81, 40/81, 64/81, 40/81, 25/81, 40/81, 25/81])
+    ),
+}
+
+
 def gauss_points_weights_edge(n_points: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
     """
     Generate Gauss points and weights for a 1D Gaussian integration on the interval [-1, +1].
 
+    The returned arrays are shared, read-only instances.
+
     Args:
         n_points: Number of integration points.
 
@@ -23,15 +82,11 @@ def gauss_points_weights_edge(n_points: int) -> tuple[npt.NDArray[np.float64], n
     Returns:
         A tuple containing the Gauss points and weights.
     """
-    if n_points == 1:
-        return np.array([0.0]), np.array([2.0])
-    elif n_points == 2:
-        return np.array([-1/np.sqrt(3), 1/np.sqrt(3)]), np.array([1.0, 1.0])
-    elif n_points == 3:
-        return np.array([-np.sqrt(3/5), 0.0, np.sqrt(3/5)]), np.array([5/9, 8/9, 5/9])
-    else:
+    try:
+        return _EDGE_RULES[n_points]
+    except KeyError:
         raise ValueError(f"Unsupported number of Gauss points: {n_points}. "
-                         f"'n_points' must be 1, 2, or 3.")
+                         f"'n_points' must be 1, 2, or 3.") from None
 
 
 def gauss_points_weights_triangle(n_points: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
@@ -41,6 +96,7 @@ def gauss_points_weights_triangle(n_points: int) -> tuple[npt.NDArray[np.float64
     Triangle is assumed to be a unit triangle with vertices at (0,0), (1,0), and (0,1).
 
     The weights are multiplied by the area of the triangle (1/2 for a unit triangle).
+    The returned arrays are shared, read-only instances.
 
     Args:
         n_points: Number of integration points.
@@ -51,17 +107,11 @@ def gauss_points_weights_triangle(n_points: int) -> tuple[npt.NDArray[np.float64
     Returns:
         A tuple containing the Gauss points and weights.
     """
-    if n_points == 1:
-        return np.array([[1.0/3.0, 1.0/3.0, 1.0/3.0]]), 0.5 * np.array([1.0])
-    elif n_points == 3:
-        return np.array([
-            [2.0/3.0, 1.0/6.0, 1.0/6.0],
-            [1.0/6.0, 2.0/3.0, 1.0/6.0],
-            [1.0/6.0, 1.0/6.0, 2.0/3.0]]
-        ), 0.5 * np.array([1.0/3.0, 1.0/3.0, 1.0/3.0])
-    else:
+    try:
+        return _TRIANGLE_RULES[n_points]
+    except KeyError:
         raise ValueError(f"Unsupported number of Gauss points: {n_points}. "
-                         f"'n_points' must be 1 or 3.")
+                         f"'n_points' must be 1 or 3.") from None
 
 
 def gauss_points_weights_quadrilateral(n_points: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
@@ -69,6 +119,7 @@ def gauss_points_weights_quadrilateral(n_points: int) -> tuple[npt.NDArray[np.fl
     Generate Gauss points and weights for a quadrilateral Gaussian integration.
 
     Quadrilateral is assumed to be a square with vertices at (-1,-1), (1,-1), (1,1), and (-1,1).
+    The returned arrays are shared, read-only instances.
 
     Args:
         n_points: Number of integration points.
@@ -79,29 +130,8 @@ def gauss_points_weights_quadrilateral(n_points: int) -> tuple[npt.NDArray[np.fl
     Returns:
         A tuple containing the Gauss points and weights.
     """
-    if n_points == 1:
-        return np.array([[0.0, 0.0]]), np.array([4.0])
-    elif n_points == 4:
-        return np.array([
-            [-1.0/sqrt(3.0), -1.0/sqrt(3.0)],
-            [+1.0/sqrt(3.0), -1.0/sqrt(3.0)],
-            [+1.0/sqrt(3.0), +1.0/sqrt(3.0)],
-            [-1.0/sqrt(3.0), +1.0/sqrt(3.0)],
-        ]
-        ), np.array([1.0, 1.0, 1.0, 1.0])
-    elif n_points == 9:
-        return np.array([
-            [-sqrt(3.0/5.0), -sqrt(3.0/5.0)],
-            [0.0, -sqrt(3.0/5.0)],
-            [+sqrt(3.0/5.0), -sqrt(3.0/5.0)],
-            [-sqrt(3.0/5.0), 0.0],
-            [0.0, 0.0],
-            [+sqrt(3.0/5.0), 0.0],
-            [-sqrt(3.0/5.0), +sqrt(3.0/5.0)],
-            [0.0, +sqrt(3.0/5.0)],
-            [+sqrt(3.0/5.0), +sqrt(3.0/5.0)],
-        ]
-        ), np.array([25/81, 40/81, 25/81, 40/81, 64/81, 40/81, 25/81, 40/81, 25/81])
-    else:
+    try:
+        return _QUADRILATERAL_RULES[n_points]
+    except KeyError:
         raise ValueError(f"Unsupported number of Gauss points: {n_points}. "
-                         f"'n_points' must be 1,4 or 9.")
+                         f"'n_points' must be 1,4 or 9.") from None
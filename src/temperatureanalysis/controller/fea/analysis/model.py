@@ -43,7 +43,10 @@ class Model:
         self.dqdT_global: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
         self.t_global: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)  # Global temperature vector
 
-        self.dof_connectivity_matrix: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self.dof_connectivity_matrix: npt.NDArray[np.int64] = np.empty((0, 0), dtype=np.int64)
+        # COO row and column indices of all element matrices, see `assemble_global_dofs`
+        self.coo_rows: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self.coo_cols: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
 
         self.neq_free: int = 0  # Number of free equations (degrees of freedom)
         self.neq_fixed: int = 0  # Number of fixed equations (degrees of freedom)
@@ -67,19 +70,36 @@ class Model:
         """
         Assemble the global degrees of freedom (DOFs) connectivity matrix.
 
-        This method creates a connectivity matrix that maps the local DOFs of each element to the global DOFs.
+        Row ``e`` of the connectivity matrix holds the global DOFs of surface element ``e``, with the
+        elements ordered by sorted physical group name as in the solver; rows of elements with fewer
+        nodes are padded with -1. The COO row and column indices of all element matrices are built
+        from it once, without a Python loop over the elements, and kept for reuse in every time step.
         """
-        self.dof_connectivity_matrix = np.full(
-            (self.number_of_elements, self.n_dof_per_node * self.mesh.max_nodes_per_element),
-            np.nan,
-            dtype=np.int64
+        local_dofs = np.arange(self.n_dof_per_node, dtype=np.int64)
+        connectivity = self.mesh.connectivity()
+
+        # Global DOFs of each element, (E, nodes_per_element * n_dof_per_node) per physical group
+        dof_blocks = [
+            (connectivity[name][:, :, None] * self.n_dof_per_node + local_dofs).reshape(len(connectivity[name]), -1)
+            for name in sorted(connectivity)
+        ]
+
+        n_elements = sum(len(dofs) for dofs in dof_blocks)
+        width = max((dofs.shape[1] for dofs in dof_blocks), default=0)
+        self.dof_connectivity_matrix = np.full((n_elements, width), -1, dtype=np.int64)
+
+        start = 0
+        for dofs in dof_blocks:
+            self.dof_connectivity_matrix[start:start + len(dofs), :dofs.shape[1]] = dofs
+            start += len(dofs)
+
+        # Row-major (i, j) pairs of every element matrix, matching Ke.ravel()
+        self.coo_rows = np.concatenate(
+            [np.repeat(dofs, dofs.shape[1], axis=1).ravel() for dofs in dof_blocks] or [np.empty(0, dtype=np.int64)]
+        )
+        self.coo_cols = np.concatenate(
+            [np.tile(dofs, dofs.shape[1]).ravel() for dofs in dof_blocks] or [np.empty(0, dtype=np.int64)]
         )
-
-        # 1) Setup the global DoF mapping
-        for elements in self.mesh.elements.values():
-            for i, element in elements:
-                for j, node in enumerate(element.nodes):
-                    node.global_dofs = np.zeros((node.n_dof_per_node,), dtype=int)
 
     # def plot_temperature_distribution(self, time: float) -> None:
     #     plt.rcParams["figure.constrained_layout.use"] = True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -8,40 +9,105 @@ if TYPE_CHECKING:
     import numpy.typing as npt
 
 
+INITIAL_TEMPERATURE = 273.15 + 20.0
+
+# Shared read-only placeholders, so creating a node allocates no arrays of its own
+_NO_DOFS = np.empty(0, dtype=np.int64)
+_NO_DOFS.setflags(write=False)
+_NO_HISTORY = np.empty(0, dtype=np.float64)
+_NO_HISTORY.setflags(write=False)
+
+
+@dataclass
+class NodeStore:
+    """
+    Structure-of-arrays storage for the nodal data of a whole mesh.
+
+    Row ``i`` belongs to the node with ``uid == i``, so element temperatures are
+    a single gather ``current_temperature[element.global_dofs]``.
+
+    Attributes:
+        coords: Node coordinates [X, Y], shape (n_nodes, 2).
+        current_temperature: Current node temperatures in Kelvin, shape (n_nodes,).
+    """
+    coords: npt.NDArray[np.float64]
+    current_temperature: npt.NDArray[np.float64]
+
+    @classmethod
+    def empty(cls, n_nodes: int) -> NodeStore:
+        """Create a store for `n_nodes` nodes at the initial temperature."""
+        return cls(
+            coords=np.zeros((n_nodes, 2), dtype=np.float64),
+            current_temperature=np.full(n_nodes, INITIAL_TEMPERATURE, dtype=np.float64),
+        )
+
+
 class Node:
     """
     Represents a node in a temperature analysis simulation.
     """
+
+    __slots__ = ("coords", "uid", "store", "global_dofs", "temperature_history", "_x", "_y", "_current_temperature")
+
     def __init__(
         self,
         index: int,
         coords: list[float] | npt.NDArray[np.float64],
+        store: NodeStore | None = None,
     ) -> None:
         """
         Initialize the node with coordinates.
 
         Args:
             coords: Coordinates of the node in the global system [X, Y].
+            store: Optional mesh-wide node storage; if given, the node's coordinates and
+                temperature live in row `index` of the store, and `coords` is a view of that row.
+
+        `coords` is read-only after construction: `x`, `y` and the element data derived from
+        the coordinates are cached, so moving a node would leave them stale.
         """
-        self.coords = np.array(coords, dtype=np.float64)
+        if store is not None:
+            store.coords[index] = coords[:2]  # No-op when `coords` already is the store row
+            self.coords = store.coords[index]
+        else:
+            self.coords = np.array(coords, dtype=np.float64)
+        self.coords.flags.writeable = False
+        # Plain floats, so reading x and y does not go through NumPy scalar indexing
+        self._x = float(self.coords[0])
+        self._y = float(self.coords[1])
         self.uid = index
-        self.global_dofs: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
-        self.current_temperature: float | None = 273.15 + 20.0
-        self.temperature_history: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self.store = store
+        self.global_dofs: npt.NDArray[np.int64] = _NO_DOFS
+        self._current_temperature: float | None = INITIAL_TEMPERATURE
+        self.temperature_history: npt.NDArray[np.float64] = _NO_HISTORY
 
     def __repr__(self) -> str:
         """String representation of the node."""
         return f"{self.__class__.__name__}(id={self.uid}, coords={self.coords})"
 
+    @property
+    def current_temperature(self) -> float | None:
+        """Current temperature of the node in Kelvin."""
+        if self.store is not None:
+            return float(self.store.current_temperature[self.uid])
+        return self._current_temperature
+
+    @current_temperature.setter
+    def current_temperature(self, value: float | None) -> None:
+        if self.store is not None:
+            self.store.current_temperature[self.uid] = value
+        else:
+            self._current_temperature = value
+
     @property
     def x(self) -> float:
         """X-coordinate of the node."""
-        return self.coords[0]
+        return self._x
 
     @property
     def y(self) -> float:
         """Y-coordinate of the node."""
-        return self.coords[1]
+        return self._y
 
     def plot_temperature_history(self, dt:float, name: str = "") -> None:
         """Plot the temperature history of the node."""
@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -41,6 +40,8 @@ class FireCurve(ABC):
         """
         Plot the fire curve.
         """
+        import matplotlib.pyplot as plt
+
         times = np.linspace(0, 180 * 60, 500)  # 180 minutes in seconds
         temperatures = self.get_temperature(times)
 
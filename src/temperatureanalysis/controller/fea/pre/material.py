@@ -8,16 +8,24 @@ from typing import TYPE_CHECKING, Optional
 import numpy as np
 
 from temperatureanalysis.controller.fea.pre.material_helpers import (
-    concrete_props_batch, steel_props_batch, generic_props_batch
+    concrete_k_batch, concrete_props_batch, steel_props_batch, generic_props_batch
 )
 
 from temperatureanalysis.controller.fea.utils import kelvin_to_celsius
-from temperatureanalysis.model.materials import ThermalConductivityBoundary
+from temperatureanalysis.model.materials import ThermalConductivityBoundary, MOISTURE_CONTENTS, MOISTURE_PEAKS
 
 if TYPE_CHECKING:
     import numpy.typing as npt
 
 
+def _scalar_or_array(
+    values: npt.NDArray[np.float64],
+    temperature_K: float | npt.NDArray[np.float64]
+) -> float | npt.NDArray[np.float64]:
+    """Return a Python float for a scalar temperature and the array otherwise."""
+    return float(values) if np.ndim(temperature_K) == 0 else values
+
+
 class Material(ABC):
     """Abstract base class for materials used in temperature analysis."""
 
@@ -39,50 +47,50 @@ class Material(ABC):
         self.initial_density = initial_density
 
     @abstractmethod
-    def thermal_conductivity(self, temperature_K: float) -> float:
+    def thermal_conductivity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the thermal conductivity of the material at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Thermal conductivity in W/(m·K).
+            float | ndarray: Thermal conductivity in W/(m·K).
         """
         pass
 
     @abstractmethod
-    def density(self, temperature_K: float) -> float:
+    def density(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the density of the material at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Density in kg/m³.
+            float | ndarray: Density in kg/m³.
         """
         pass
 
 
     @abstractmethod
-    def specific_heat_capacity(self, temperature_K: float) -> float:
+    def specific_heat_capacity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the specific heat capacity of the material at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Specific heat capacity in J/(kg·K).
+            float | ndarray: Specific heat capacity in J/(kg·K).
         """
         pass
 
-    def volumetric_heat_capacity(self, temperature_K: float) -> float:
+    def volumetric_heat_capacity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the volumetric heat capacity of the material at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Volumetric heat capacity in J/(m³·K).
+            float | ndarray: Volumetric heat capacity in J/(m³·K).
         """
         return self.density(temperature_K) * self.specific_heat_capacity(temperature_K)
 
@@ -120,7 +128,7 @@ class GenericTabulatedMaterial(Material):
         self.thermal_conductivities = thermal_conductivities
         self.specific_heat_capacities = specific_heat_capacities
 
-    def thermal_conductivity(self, temperature_K: float) -> float:
+    def thermal_conductivity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         temps = self.thermal_conductivities[0]
         lambs = self.thermal_conductivities[1]
 
@@ -132,7 +140,7 @@ class GenericTabulatedMaterial(Material):
             right=lambs[-1]
         )
 
-    def density(self, temperature_K: float) -> float:
+    def density(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         temps = self.densities[0]
         dens = self.densities[1]
 
@@ -144,7 +152,7 @@ class GenericTabulatedMaterial(Material):
             right=dens[-1]
         )
 
-    def specific_heat_capacity(self, temperature_K: float) -> float:
+    def specific_heat_capacity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         temps = self.specific_heat_capacities[0]
         cps = self.specific_heat_capacities[1]
 
@@ -199,10 +207,8 @@ class Concrete(Material):
         self.boundary = boundary
         self.u = initial_moisture_content
 
-        # Moisture bump for specific heat capacity
-        u_V = np.array([0.0, 1.5, 3.0, 10.0])
-        d_V = np.array([900.0, 1470.0, 2020.0, 5600.0]) - 900.0
-        self.d: float = np.interp(self.u, u_V, d_V)
+        # Moisture bump for specific heat capacity, from the table shared with the UI preview
+        self.d: float = float(np.interp(self.u, MOISTURE_CONTENTS, MOISTURE_PEAKS))
 
         super().__init__(
             name=name,
@@ -210,74 +216,80 @@ class Concrete(Material):
             initial_density=initial_density
         )
 
-    def thermal_conductivity(self, temperature_K: float) -> float:
+    def thermal_conductivity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """
         Calculate the thermal conductivity of concrete at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Thermal conductivity in W/(m·K).
+            float | ndarray: Thermal conductivity in W/(m·K).
         """
-        temp_C = kelvin_to_celsius(temperature_K)
+        use_upper = (self.boundary == ThermalConductivityBoundary.UPPER)
+        if np.ndim(temperature_K) > 0:
+            # Arrays go through the JIT'd kernel in a single pass (compiled on first use, then cached on disk)
+            t = np.ascontiguousarray(temperature_K, dtype=np.float64)
+            return concrete_k_batch(t.ravel(), use_upper).reshape(t.shape)
 
-        if self.boundary == ThermalConductivityBoundary.UPPER:
-            if temp_C <= 1200.0:
-                return 2 - 0.2451 * (temp_C / 100.0) + 0.0107 * (temp_C / 100.0) ** 2
-            # temp_C > 1200.0
-            return 0.5996
+        temp_C = kelvin_to_celsius(np.asarray(temperature_K, dtype=np.float64))
+        x = temp_C / 100.0
+
+        if use_upper:
+            k = np.where(temp_C <= 1200.0, 2 - 0.2451 * x + 0.0107 * x ** 2, 0.5996)
+        else:
+            # Lower boundary
+            k = np.where(temp_C <= 1200.0, 1.36 - 0.136 * x + 0.0057 * x ** 2, 0.5488)
 
-        # Lower boundary
-        if temp_C <= 1200.0:
-            return 1.36 - 0.136 * (temp_C / 100.0) + 0.0057 * (temp_C / 100.0) ** 2
-        # temp_C > 1200.0
-        return 0.5488
+        return _scalar_or_array(k, temperature_K)
 
-    def density(self, temperature_K: float) -> float:
+    def density(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the density of the concrete at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Density in kg/m³.
+            float | ndarray: Density in kg/m³.
         """
-        temp_C = kelvin_to_celsius(temperature_K)
-
-        if temp_C <= 115.0:
-            return self.initial_density
-        if temp_C <= 200.0:
-            return self.initial_density * (1 - 0.02 * (temp_C - 115.0) / 85.0)
-        if temp_C <= 400.0:
-            return self.initial_density * (0.98 - 0.03 * (temp_C - 200.0) / 200.0)
-        # else:
-        return self.initial_density * (0.95 - 0.07 * (temp_C - 400.0) / 800.0)
+        temp_C = kelvin_to_celsius(np.asarray(temperature_K, dtype=np.float64))
+
+        factor = np.select(
+            [temp_C <= 115.0, temp_C <= 200.0, temp_C <= 400.0],
+            [
+                1.0,
+                1 - 0.02 * (temp_C - 115.0) / 85.0,
+                0.98 - 0.03 * (temp_C - 200.0) / 200.0,
+            ],
+            default=0.95 - 0.07 * (temp_C - 400.0) / 800.0,
+        )
+        return _scalar_or_array(self.initial_density * factor, temperature_K)
 
 
-    def specific_heat_capacity(self, temperature_K: float) -> float:
+    def specific_heat_capacity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the specific heat capacity of the concrete at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Specific heat capacity in J/(kg·K).
+            float | ndarray: Specific heat capacity in J/(kg·K).
         """
-        temp_C = kelvin_to_celsius(temperature_K)
+        temp_C = kelvin_to_celsius(np.asarray(temperature_K, dtype=np.float64))
 
         d = self.d
 
-        if temp_C <= 100.0:
-            return 900.0
-        if temp_C <= 115.0:
-            return 900.0 + d
-        if temp_C <= 200.0:
-            return 900.0 + d - ( (900.0 + d - 1000.0) / 85.0 ) * (temp_C - 115.0)
-        if temp_C <= 400.0:
-            return 1000.0 + (temp_C - 200.0) / 2.0
-        # else:
-        return 1100.0
+        c_p = np.select(
+            [temp_C <= 100.0, temp_C <= 115.0, temp_C <= 200.0, temp_C <= 400.0],
+            [
+                900.0,
+                900.0 + d,
+                900.0 + d - ( (900.0 + d - 1000.0) / 85.0 ) * (temp_C - 115.0),
+                1000.0 + (temp_C - 200.0) / 2.0,
+            ],
+            default=1100.0,
+        )
+        return _scalar_or_array(c_p, temperature_K)
 
     def props_batch(self, T_K: npt.NDArray[np.float64]) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         """
@@ -316,51 +328,54 @@ class Steel(Material):
             initial_density=initial_density
         )
 
-    def thermal_conductivity(self, temperature_K: float) -> float:
+    def thermal_conductivity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the thermal conductivity of steel at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Thermal conductivity in W/(m·K).
+            float | ndarray: Thermal conductivity in W/(m·K).
         """
-        temp_C = kelvin_to_celsius(temperature_K)
+        temp_C = kelvin_to_celsius(np.asarray(temperature_K, dtype=np.float64))
 
-        if temp_C <= 800.0:
-            return 54.0 - 3.33 * temp_C / 100.0
-        return 27.3
+        k = np.where(temp_C <= 800.0, 54.0 - 3.33 * temp_C / 100.0, 27.3)
+        return _scalar_or_array(k, temperature_K)
 
-    def density(self, temperature_K: float) -> float:
+    def density(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the density of steel at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Density in kg/m³.
+            float | ndarray: Density in kg/m³.
         """
-        return self.initial_density
+        return _scalar_or_array(np.full(np.shape(temperature_K), self.initial_density), temperature_K)
 
-    def specific_heat_capacity(self, temperature_K: float) -> float:
+    def specific_heat_capacity(self, temperature_K: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """Calculate the specific heat capacity of steel at a given temperature in Kelvin.
 
         Args:
-            temperature_K (float): Temperature in Kelvin.
+            temperature_K (float | ndarray): Temperature(s) in Kelvin.
 
         Returns:
-            float: Specific heat capacity in J/(kg·K).
+            float | ndarray: Specific heat capacity in J/(kg·K).
         """
-        temp_C = kelvin_to_celsius(temperature_K)
-        if temp_C <= 600.0:
-            return self.initial_density * (425.0 + 7.73 * temp_C / 10.0 - 1.69 * (temp_C ** 2.0) / 1000.0 + 2.22 * (
-                    temp_C ** 3) / 1_000_000.0)
-        elif temp_C <= 735.0:
-            return self.initial_density * (666.0 - (13_002.0 / (temp_C - 738.0)))
-        elif temp_C <= 900.0:
-            return self.initial_density * (545.0 + 17_820.0 / (temp_C - 731.0))
-        else:
-            return self.initial_density * 650.0
+        temp_C = kelvin_to_celsius(np.asarray(temperature_K, dtype=np.float64))
+
+        # All branches are evaluated, so silence the poles of the branches that are not selected
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c_p = np.select(
+                [temp_C <= 600.0, temp_C <= 735.0, temp_C <= 900.0],
+                [
+                    425.0 + 7.73 * temp_C / 10.0 - 1.69 * (temp_C ** 2.0) / 1000.0 + 2.22 * (temp_C ** 3) / 1_000_000.0,
+                    666.0 - (13_002.0 / (temp_C - 738.0)),
+                    545.0 + 17_820.0 / (temp_C - 731.0),
+                ],
+                default=650.0,
+            )
+        return _scalar_or_array(self.initial_density * c_p, temperature_K)
 
     def props_batch(self, T_K: npt.NDArray[np.float64]) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         """
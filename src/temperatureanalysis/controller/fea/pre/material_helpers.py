@@ -125,6 +125,31 @@ def concrete_props_batch(
         rhoc[i] = rho * cp
     return k, rhoc
 
+@nb.njit(cache=True, fastmath=True)
+def concrete_k_batch(
+    T_K: npt.NDArray[np.float64],
+    use_upper_k: bool
+) -> npt.NDArray[np.float64]:
+    """
+    Batched concrete thermal conductivity.
+
+    Args:
+        T_K:         Temperatures in Kelvin, shape (n,).
+        use_upper_k: If True, use upper-bound k(T); otherwise lower-bound.
+
+    Returns:
+        k: Thermal conductivity per T (W/(m·K)), shape (n,).
+    """
+    n = T_K.size
+    k = np.empty(n, np.float64)
+    if use_upper_k:
+        for i in range(n):
+            k[i] = concrete_k_upper(T_K[i] - 273.15)
+    else:
+        for i in range(n):
+            k[i] = concrete_k_lower(T_K[i] - 273.15)
+    return k
+
 @nb.njit(cache=True, fastmath=True)
 def steel_props_batch(
     T_K: npt.NDArray[np.float64],
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import os
+import pickle
 from datetime import datetime
 
 from collections import defaultdict
 
 import numpy as np
-import matplotlib.pyplot as plt
 import gmsh
 
 from temperatureanalysis.controller.fea.pre.fire_curves import FireCurve
 from temperatureanalysis.controller.fea.pre.material import Material
-from temperatureanalysis.controller.fea.analysis.node import Node
+from temperatureanalysis.controller.fea.analysis.node import Node, NodeStore
 from temperatureanalysis.controller.fea.analysis.finite_elements.finite_element import FiniteElement
 from temperatureanalysis.controller.fea.analysis.finite_elements.tri3 import Tri3
 from temperatureanalysis.controller.fea.analysis.finite_elements.tri6 import Tri6
@@ -22,7 +23,7 @@ from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    pass
+    import numpy.typing as npt
 
 LINE_ELEMENT_TYPE_MAP = {
     1: (Line2, 2),  # 2-node line
@@ -43,6 +44,18 @@ ELEMENT_TYPE_MAP = {
 
 THERMOCOUPLE_PREFIX = "THERMOCOUPLE"
 
+MESH_CACHE_SUFFIX = ".cache.pkl"
+
+# Meshes with more nodes than this are plotted without element and node labels
+MAX_ANNOTATED_ENTITIES = 500
+
+# (node tags, node coordinates, [(dim, entity tag, [(physical tag, name)], [(element type, tags, node tags)])])
+GmshData = tuple[
+    np.ndarray,
+    np.ndarray,
+    list[tuple[int, int, list[tuple[int, str]], list[tuple[int, np.ndarray, np.ndarray]]]],
+]
+
 class Mesh:
     def __init__(
         self,
@@ -52,17 +65,29 @@ class Mesh:
         filename: str | None = None,
         gmsh_nodes_mapping: list[tuple[int, int]] | None = None,
         thermocouples: dict[str, Node] | None = None,
+        node_store: NodeStore | None = None,
+        connectivity: dict[str, npt.NDArray[np.int64]] | None = None,
+        boundary_connectivity: dict[str, npt.NDArray[np.int64]] | None = None,
     ) -> None:
         """
         Initialize the Mesh class.
+
+        `connectivity` and `boundary_connectivity` optionally seed the node index tables
+        returned by `connectivity()`, e.g. straight from the element blocks of a mesh file.
         """
         nodes.sort(key=lambda node: node.uid)
         self.nodes = nodes
+        self.node_store = node_store  # Shared SoA node data, if the nodes were created with one
         self.elements = elements
         self.boundary_elements = boundary_elements
         self.thermocouples = thermocouples or {}
         self.filename = filename
         self.gmsh_nodes_mapping = gmsh_nodes_mapping  # (gmsh position, zero-based index)
+        # Cached (E, nodes_per_element) node index tables per physical group, keyed by `boundary`
+        self._connectivity: dict[bool, dict[str, npt.NDArray[np.int64]]] = {
+            False: dict(connectivity or {}),
+            True: dict(boundary_connectivity or {}),
+        }
 
     @classmethod
     def from_file(
@@ -70,6 +95,7 @@ class Mesh:
         filename: str,
         physical_surface_to_material_mapping: dict[str, Material],
         physical_line_to_fire_curve_mapping: dict[str, FireCurve],
+        use_cache: bool = False,
     ) -> Mesh:
         """
         Strict, string-only parsing with three kinds of entities:
@@ -82,28 +108,36 @@ class Mesh:
             - set(surface_to_material_mapping.keys()) == set(surface names in mesh)
             - set(boundary_to_fire_curve_mapping.keys()) == set(line names in mesh)
 
+        If `use_cache` is True, the raw data read through gmsh is pickled next to the
+        mesh file (``<filename>.cache.pkl``) and reused while the file's mtime and size
+        are unchanged. Materials and fire curves are always taken from the mappings.
         """
-        gmsh.initialize()
-        gmsh.open(filename)
-
-        # 1) Read all nodes once
-        node_tags, flat_coords, _ = gmsh.model.mesh.get_nodes()
-        coords = flat_coords.reshape(-1, 3)  # Reshape to (num_nodes, 3)
-        nodes: list[Node] = []
-        nodes_lookup: dict[int, Node] = {}
-        nodes_mapping: list[tuple[int, int]] = []  # stores the mapping from GMSH file node position to zero-based index
-
-        for i, (tag, xy) in enumerate(zip(node_tags, coords[:, :2])):  # Use only x and y coordinates
-            zero_based_index = tag - 1  # GMSH uses 1-based indexing, convert to 0-based
-            node = Node(index=zero_based_index, coords=xy)
-            nodes.append(node)
-            nodes_lookup[zero_based_index] = node
-            nodes_mapping.append((i, zero_based_index))
+        node_tags, coords, entities = cls._read_gmsh_data(filename, use_cache=use_cache)
+
+        # 1) Create all nodes once, backed by a single structure-of-arrays store
+        node_store = NodeStore.empty(len(node_tags))
+        zero_based_tags = (np.asarray(node_tags, dtype=np.int64) - 1).tolist()  # GMSH uses 1-based indexing
+        node_store.coords[zero_based_tags] = coords[:, :2]  # Use only x and y coordinates, copied in bulk
+
+        # The node's coordinates are a view of its row in the store, no per-node copy.
+        # Built in single passes, no per-node appends
+        store_coords = node_store.coords
+        nodes: list[Node] = [
+            Node(index=zero_based_index, coords=store_coords[zero_based_index], store=node_store)
+            for zero_based_index in zero_based_tags
+        ]
+        nodes_lookup: dict[int, Node] = dict(zip(zero_based_tags, nodes))
+        # stores the mapping from GMSH file node position to zero-based index
+        nodes_mapping: list[tuple[int, int]] = list(enumerate(zero_based_tags))
 
         # 2) Prepare containers for elements by physical-group names
         surface_elements: dict[str, list[FiniteElement]] = defaultdict(list)
         boundary_elements: dict[str, list[LineElement]] = defaultdict(list)
 
+        # Node index tables of the element blocks, in the same order as the elements above
+        surface_blocks: dict[str, list[npt.NDArray[np.int64]]] = defaultdict(list)
+        boundary_blocks: dict[str, list[npt.NDArray[np.int64]]] = defaultdict(list)
+
         # Track used physical tags for the 1:1 mapping check later
         used_surface_physical_tags: set[str] = set()
         used_line_physical_tags: set[str] = set()
@@ -111,20 +145,18 @@ class Mesh:
         # temporary storage for points -> set of zero-based node indices (validate to exactly one later)
         thermocouples_temporary: dict[str, set[int]] = defaultdict(set)
 
-        def get_single_named_physical(dim: int, entity_tag: int) -> str:
+        def get_single_named_physical(dim: int, entity_tag: int, physicals: list[tuple[int, str]]) -> str:
             """
             Strict resolver, requires exactly one non-empty physical name.
             """
-            phys_tags = gmsh.model.get_physical_groups_for_entity(dim, entity_tag)
-            if not phys_tags:
+            if not physicals:
                 raise ValueError(
                     f"Entity (dim={dim}, tag={entity_tag}) has no associated physical group. "
                     "Every entity with elements must belong to exactly one physical group."
                 )
 
             names = []
-            for pt in phys_tags:
-                name = gmsh.model.get_physical_name(dim, pt)
+            for pt, name in physicals:
                 if name is None or name.strip() == "":
                     raise ValueError(
                         f"Physical group (dim={dim}, tag={pt}) has empty/undefined name. "
@@ -141,24 +173,10 @@ class Mesh:
 
             return names[0]
 
-        # 3) Loop all gmsh entities to pick up physical-group names and entities' elements
-        for dim, entity_tag in gmsh.model.get_entities():
-            # Get the element types and tags and node connectivity for this entity
-            element_types, element_tags_list, node_tags = gmsh.model.mesh.get_elements(dim, entity_tag)
-            if element_types.size == 0:
-                continue  # No elements for this entity, skip
-
-            blocks = [
-                (t, etags, ntags)
-                for t, etags, ntags in zip(element_types, element_tags_list, node_tags)
-                if t in ELEMENT_TYPE_MAP or t == 15  # 15 is for point elements (thermocouples)
-            ]
-
-            if not blocks:
-                continue
-
+        # 3) Loop all gmsh entities with supported elements to pick up physical-group names and elements
+        for dim, entity_tag, physicals, blocks in entities:
             # Determine the strict domain name; this also validates the name exists in mapping
-            domain_name = get_single_named_physical(dim, entity_tag)
+            domain_name = get_single_named_physical(dim, entity_tag, physicals)
 
             # Points (thermocouples)
             point_blocks = [(t, etags, ntags) for t, etags, ntags in blocks if t == 15]
@@ -205,7 +223,7 @@ class Mesh:
             # Build elements
 
             # Loop through each element type
-            for element_type, element_tags, flat_node_tags in zip(element_types, element_tags_list, node_tags):
+            for element_type, element_tags, flat_node_tags in blocks:
                 if element_type not in ELEMENT_TYPE_MAP:
                     # Skip unsupported element types
                     continue
@@ -217,6 +235,11 @@ class Mesh:
                 is_line = element_type in LINE_ELEMENT_TYPE_MAP
                 is_surface = element_type in SURFACE_ELEMENT_TYPE_MAP
 
+                if is_line:
+                    boundary_blocks[domain_name].append(node_connectivity_matrix.astype(np.int64))
+                elif is_surface:
+                    surface_blocks[domain_name].append(node_connectivity_matrix.astype(np.int64))
+
                 # Instantiate elements
                 for node_tags_for_element, element_tag in zip(node_connectivity_matrix, element_tags):
                     # Get the nodes for this element
@@ -272,18 +295,95 @@ class Mesh:
         if msgs:
             raise ValueError("Physical names do not correspond to the dictionaries (" + " | ".join(msgs) + ").")
 
-
-        gmsh.finalize()
-
         return cls(
             nodes=nodes,
             elements=surface_elements,
             boundary_elements=boundary_elements,
             filename=filename,
             gmsh_nodes_mapping=nodes_mapping,
-            thermocouples=thermocouples
+            thermocouples=thermocouples,
+            node_store=node_store,
+            connectivity=cls._stack_blocks(surface_blocks),
+            boundary_connectivity=cls._stack_blocks(boundary_blocks),
         )
 
+    @staticmethod
+    def _stack_blocks(blocks: dict[str, list[npt.NDArray[np.int64]]]) -> dict[str, npt.NDArray[np.int64]]:
+        """
+        Concatenate the element block tables of each physical group into one table.
+
+        Groups mixing element types with different node counts are left out; `connectivity()`
+        handles them from the elements themselves.
+        """
+        return {
+            name: np.concatenate(tables)
+            for name, tables in blocks.items()
+            if len({table.shape[1] for table in tables}) == 1
+        }
+
+    @staticmethod
+    def _read_gmsh_data(filename: str, use_cache: bool = False) -> GmshData:
+        """
+        Read nodes and supported element blocks (with their physical groups) through gmsh.
+
+        With `use_cache`, the result is pickled to ``<filename>.cache.pkl`` keyed by the
+        file's path, mtime and size, and loaded from there on subsequent calls.
+        """
+        cache_path = filename + MESH_CACHE_SUFFIX
+        cache_key = None
+        if use_cache:
+            stat = os.stat(filename)
+            cache_key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+            try:
+                with open(cache_path, "rb") as f:
+                    cached_key, cached_data = pickle.load(f)
+                if cached_key == cache_key:
+                    return cached_data
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+                pass  # Missing or unreadable cache, fall back to parsing the mesh
+
+        gmsh.initialize()
+        try:
+            gmsh.open(filename)
+
+            # Read all nodes once
+            node_tags, flat_coords, _ = gmsh.model.mesh.get_nodes()
+            coords = flat_coords.reshape(-1, 3)  # Reshape to (num_nodes, 3)
+
+            entities: list[tuple[int, int, list[tuple[int, str]], list[tuple[int, np.ndarray, np.ndarray]]]] = []
+            for dim, entity_tag in gmsh.model.get_entities():
+                # Get the element types and tags and node connectivity for this entity
+                element_types, element_tags_list, entity_node_tags = gmsh.model.mesh.get_elements(dim, entity_tag)
+                if element_types.size == 0:
+                    continue  # No elements for this entity, skip
+
+                blocks = [
+                    (int(t), etags, ntags)
+                    for t, etags, ntags in zip(element_types, element_tags_list, entity_node_tags)
+                    if t in ELEMENT_TYPE_MAP or t == 15  # 15 is for point elements (thermocouples)
+                ]
+
+                if not blocks:
+                    continue
+
+                physicals = [
+                    (int(pt), gmsh.model.get_physical_name(dim, pt))
+                    for pt in gmsh.model.get_physical_groups_for_entity(dim, entity_tag)
+                ]
+                entities.append((dim, entity_tag, physicals, blocks))
+        finally:
+            gmsh.finalize()
+
+        data = (node_tags, coords, entities)
+        if use_cache:
+            try:
+                with open(cache_path, "wb") as f:
+                    pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                pass  # Caching is best effort only
+
+        return data
+
     @property
     def max_nodes_per_element(self) -> int:
         """Return the maximum number of nodes per element in the mesh."""
@@ -291,6 +391,44 @@ class Mesh:
             return 0
         return max(len(element.nodes) for elements in self.elements.values() for element in elements)
 
+    @property
+    def coords(self) -> npt.NDArray[np.float64]:
+        """
+        Node coordinates [X, Y] as one contiguous array, row ``i`` belongs to the node with ``uid == i``.
+
+        Returns:
+            Array of shape (n_nodes, 2); a view into the node store if the mesh has one.
+        """
+        if self.node_store is not None:
+            return self.node_store.coords
+        coords = np.zeros((len(self.nodes), 2), dtype=np.float64)
+        for node in self.nodes:
+            coords[node.uid] = node.coords[:2]
+        return coords
+
+    def connectivity(self, boundary: bool = False) -> dict[str, npt.NDArray[np.int64]]:
+        """
+        Node indices of the elements of each physical group, stacked into one array per group.
+
+        Args:
+            boundary: If True, return the connectivity of the boundary (line) elements,
+                      otherwise of the surface elements.
+
+        Returns:
+            Mapping from physical group name to an array of shape (E, nodes_per_element).
+            The arrays are cached and shared, they must not be modified.
+        """
+        groups = self.boundary_elements if boundary else self.elements
+        cache = self._connectivity[boundary]
+        result: dict[str, npt.NDArray[np.int64]] = {}
+        for name, elements in groups.items():
+            if not elements:
+                continue
+            if name not in cache:
+                cache[name] = np.array([element.global_dofs for element in elements], dtype=np.int64)
+            result[name] = cache[name]
+        return result
+
     def add_node(self, node: Node) -> None:
         """Add a node to the mesh."""
         self.nodes.append(node)
@@ -298,13 +436,18 @@ class Mesh:
     def add_element(self, element: FiniteElement, domain: str) -> None:
         """Add an element to the mesh."""
         self.elements[domain].append(element)
+        self._connectivity[False].pop(domain, None)
 
     def add_boundary_element(self, element: LineElement, domain: str) -> None:
         """Add a surface element to the mesh."""
         self.boundary_elements[domain].append(element)
+        self._connectivity[True].pop(domain, None)
 
     def plot(self) -> None:
         """Plot the mesh of the model."""
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection, PolyCollection
+
         plt.rcParams["figure.constrained_layout.use"] = True
         fig = plt.figure()
 
@@ -320,44 +463,42 @@ class Mesh:
         tag_to_color = {
             tag: cmap(i % cmap.N) for i, tag in enumerate(unique_tags)
         }
-        # keep track of which tags have been seen to avoid duplicate labels
-        seen_tags = set()
+        ax = plt.gca()
+        coords = self.coords
+        annotate = len(self.nodes) <= MAX_ANNOTATED_ENTITIES
 
-        for element_tag, elements in self.elements.items():
+        # One collection per physical group instead of one artist per element
+        for element_tag, connectivity in self.connectivity().items():
             color = tag_to_color[element_tag]
-            for element in elements:
-                # Plot the polygon formed by the nodes of the element
-                coords = np.array([node.coords for node in element.nodes])
-                coords = np.vstack((coords, coords[0]))  # Close the polygon
-
-                label = element_tag if element_tag not in seen_tags else "_nolegend_"
-                seen_tags.add(element_tag)
-
-                plt.fill(coords[:, 0], coords[:, 1], color=color, lw=1, label=label, alpha=0.1)
-                plt.plot(coords[:, 0], coords[:, 1], color='black', lw=1)
+            polygons = coords[connectivity]  # (E, nodes_per_element, 2)
 
+            ax.add_collection(PolyCollection(polygons, facecolors=color, alpha=0.1, label=element_tag))
+            ax.add_collection(PolyCollection(polygons, facecolors='none', edgecolors='black', linewidths=1))
 
+            if annotate:
                 # Plot the index of the element at its centroid
-                centroid = np.mean(coords[:-1], axis=0)
-                plt.text(centroid[0], centroid[1], str(element.id), fontsize=12, color=color, ha='center', va='center')
+                for element, centroid in zip(self.elements[element_tag], polygons.mean(axis=1)):
+                    plt.text(centroid[0], centroid[1], str(element.id), fontsize=12, color=color, ha='center', va='center')
 
-        for element_tag, elements in self.boundary_elements.items():
+        for element_tag, connectivity in self.connectivity(boundary=True).items():
             color = tag_to_color[element_tag]
-            for element in elements:
-                coords = np.array([node.coords for node in element.nodes])
+            segments = coords[connectivity]  # (E, nodes_per_element, 2)
 
-                label = element_tag if element_tag not in seen_tags else "_nolegend_"
-                seen_tags.add(element_tag)
+            ax.add_collection(LineCollection(segments, colors=[color], linewidths=2, label=element_tag))
 
-                plt.plot(coords[:, 0], coords[:, 1], color=color, lw=2, label=label)
-                centroid = np.mean(coords, axis=0)
-                plt.text(centroid[0], centroid[1], str(element.id), fontsize=12, color=color, ha='center', va='center',
-                         bbox={'boxstyle': 'circle', 'facecolor': 'white', 'edgecolor': color})
+            if annotate:
+                for element, centroid in zip(self.boundary_elements[element_tag], segments.mean(axis=1)):
+                    plt.text(centroid[0], centroid[1], str(element.id), fontsize=12, color=color, ha='center', va='center',
+                             bbox={'boxstyle': 'circle', 'facecolor': 'white', 'edgecolor': color})
 
-        for node in self.nodes:
-            # Plot the nodes
-            plt.plot(node.x, node.y, 'ko')
-            plt.text(node.x, node.y, str(node.uid), fontsize=12, color='k', ha='left', va='bottom')
+        # Plot the nodes
+        plt.plot(coords[:, 0], coords[:, 1], 'ko', linestyle='none')
+        if annotate:
+            for node in self.nodes:
+                plt.text(node.x, node.y, str(node.uid), fontsize=12, color='k', ha='left', va='bottom')
+
+        # Collections do not update the data limits on their own
+        ax.autoscale_view()
 
         plt.grid(visible=True, which='major', axis='both', linestyle='-', color='gray', lw=0.5)
         plt.minorticks_on()
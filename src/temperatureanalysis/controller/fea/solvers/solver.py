@@ -7,13 +7,18 @@ import numpy as np
 import scipy as sp
 
 from temperatureanalysis.controller.fea.analysis.finite_elements.finite_element import FiniteElement
+from temperatureanalysis.controller.fea.analysis.finite_elements.edges import Line2, line2_loads_batch
+from temperatureanalysis.controller.fea.analysis.finite_elements.tri3 import (
+    Tri3, tri3_conductivity_batch, tri3_capacity_batch, tri3_props_at_gauss_points
+)
 
-from temperatureanalysis.controller.fea.utils import flatten_groups_in_order
+from temperatureanalysis.controller.fea.utils import flatten_groups_in_order, csr_pattern_and_scatter
 
 if TYPE_CHECKING:
     import numpy.typing as npt
 
     from temperatureanalysis.controller.fea.analysis.model import Model
+    from temperatureanalysis.controller.fea.pre.material import Material
 
 try:
     import pypardiso
@@ -30,6 +35,15 @@ class FEAResult:
     time_steps: list[float] = field(default_factory=list)
     temperatures: list[npt.NDArray[np.float64]] = field(default_factory=list)
 
+@dataclass
+class _Tri3Group:
+    """Element-constant arrays of all Tri3 elements sharing one material, in solver order."""
+    material: Material
+    node_ids: npt.NDArray[np.int64]  # (E, 3)
+    B: npt.NDArray[np.float64]  # (E, 2, 3)
+    det_j: npt.NDArray[np.float64]  # (E,)
+    local: npt.NDArray[np.float64]  # (E, 3, 3) view into the solver's local matrix buffer
+
 class Solver:
     """
     Class for a FEM solver.
@@ -53,80 +67,161 @@ class Solver:
         self.neq = self.model.number_of_equations
 
         # Precompute sparsity pattern and scatter vectors for surface elements (used in K and C)
-        self._A_struct, self._A_scatter = self._precompute_pattern_and_scatter(elements=self._surface_elements)
+        # from the COO indices the model builds for all element matrices at once
+        self.model.assemble_global_dofs()
+        self._A_struct, self._A_scatter = self._precompute_pattern_and_scatter(
+            elements=self._surface_elements,
+            rows=self.model.coo_rows,
+            cols=self.model.coo_cols,
+        )
 
         # Keep persistent copy of the structure for reuse
         self._K = self._A_struct.copy()
         self._C = self._A_struct.copy()
 
+        # Meshes made only of Tri3 elements assemble K and C in one batch per material
+        self._tri3_batch = (
+            self.model.mesh.node_store is not None
+            and all(type(element) is Tri3 for element in self._surface_elements)
+        )
+        if self._tri3_batch:
+            self._tri3_local = np.empty((len(self._surface_elements), 3, 3), dtype=np.float64)
+            self._tri3_groups, self._tri3_scatter = self._precompute_tri3_groups()
+
         #Precompute sparsity pattern and scatter vectors for boundary elements (used in dqdT)
         self._D_struct, self._D_scatter = self._precompute_pattern_and_scatter(elements=self._boundary_elements)
         self._dqdT = self._D_struct.copy()
 
-    def _precompute_pattern_and_scatter(self, elements: list) -> tuple[sp.sparse.csr_matrix, list[npt.NDArray[np.int64]]]:
+        # Boundaries made only of Line2 edges are evaluated in one batch over all edges
+        self._line2_batch = (
+            self.model.mesh.node_store is not None
+            and all(type(element) is Line2 for element in self._boundary_elements)
+        )
+        if self._line2_batch:
+            edges_connectivity = self.model.mesh.connectivity(boundary=True)
+            # Same order as self._boundary_elements: groups sorted by name
+            self._edges_node_ids = np.concatenate([edges_connectivity[name] for name in sorted(edges_connectivity)])
+            self._edges_coords = self.model.mesh.node_store.coords[self._edges_node_ids]  # (E, 2, 2)
+            self._edges_scatter = np.array(self._D_scatter, dtype=np.int64).ravel()  # (E * 4,)
+            self._edges_f = np.empty((len(self._boundary_elements), 2), dtype=np.float64)
+            self._edges_df = np.empty((len(self._boundary_elements), 2, 2), dtype=np.float64)
+
+        # Global load vector, reused across time steps and Newton iterations
+        self._F = np.zeros((self.neq,), dtype=np.float64)
+
+    def _precompute_pattern_and_scatter(
+        self,
+        elements: list,
+        rows: npt.NDArray[np.int64] | None = None,
+        cols: npt.NDArray[np.int64] | None = None,
+    ) -> tuple[sp.sparse.csr_matrix, list[npt.NDArray[np.int64]]]:
         """
         Precompute the sparsity pattern of the global matrices and the scatter vectors for each element.
 
+        Args:
+            elements: Elements in assembly order.
+            rows: Precomputed COO row indices of all element matrices in the same order,
+                  e.g. `Model.coo_rows`. Built from the elements' global DOFs if not given.
+            cols: Precomputed COO column indices matching `rows`, e.g. `Model.coo_cols`.
+
         Returns:
             A_template: csr_matrix with correct indptr/indices (float64 data, zeros).
             scatter_list: list of 1D arrays; for element e, scatter_list[e] gives
                           data indices in A_template.data where Ke.ravel(order="C") adds.
                           Length of each entry is (n_dofs, n_dofs) for element with n_dofs.
         """
-        # 1) Build the sparsity pattern via COO triplets
-        row_parts: list[npt.NDArray[np.int64]] = []
-        col_parts: list[npt.NDArray[np.int64]] = []
-
-        element_dofs: list[npt.NDArray[np.int64]] = []
-        for element in elements:
-            dofs = element.global_dofs
-            element_dofs.append(dofs)
-            n_dofs = dofs.size
-
-            row_parts.append(np.repeat(dofs, n_dofs))
-            col_parts.append(np.tile(dofs, n_dofs))
-
-        if not element_dofs:
+        if not elements:
             raise ValueError("No elements found in the model mesh.")
 
-        rows = np.concatenate(row_parts)
-        cols = np.concatenate(col_parts)
+        element_dofs = [element.global_dofs for element in elements]
 
-        # Use ones for a boolean-like pattern
+        # 1) Build the sparsity pattern via COO triplets, unless given
+        if rows is None or cols is None:
+            rows = np.concatenate([np.repeat(dofs, dofs.size) for dofs in element_dofs])
+            cols = np.concatenate([np.tile(dofs, dofs.size) for dofs in element_dofs])
+
+        # 2) CSR structure and the position of every element entry in A_template.data, in one pass
         neq = self.model.number_of_equations
-        pattern = sp.sparse.coo_matrix(
-            (
-                np.ones_like(rows, dtype=np.int8),
-                (rows, cols),
-            ),
-            shape=(neq, neq)
-        ).tocsr()
-
-        # Cast to float64 data with zeros, keep structure
-        A_template = pattern.astype(np.float64, copy=True)
-        A_template.data[:] = 0.0
-
-        # 2) For each element, find where each (row, col) lives in A_template.data
-        indptr, indices = A_template.indptr, A_template.indices
-        scatter_list: list[npt.NDArray[np.int64]] = []
-
-        for dofs in element_dofs:
-            n_dofs = dofs.size
-            scatter_e = np.empty(n_dofs * n_dofs, dtype=np.int64)
-
-            # For each row r in this element, search columns in that CSR row
-            pos = 0
-            for ii, r in enumerate(dofs):
-                a, b = indptr[r], indptr[r + 1]  # indices[a:b] sorted
-                # positions of all dofs within this row:
-                # searchsorted gives offsets inside indices[a:b]
-                offs = np.searchsorted(indices[a:b], dofs)
-                scatter_e[pos:pos + n_dofs] = a + offs
-                pos += n_dofs
-            scatter_list.append(scatter_e)
+        A_template, scatter = csr_pattern_and_scatter(rows, cols, shape=(neq, neq))
+
+        sizes = np.array([dofs.size * dofs.size for dofs in element_dofs], dtype=np.int64)
+        scatter_list = np.split(scatter, np.cumsum(sizes)[:-1])
 
         return A_template, scatter_list
 
+    def _precompute_tri3_groups(self) -> tuple[list[_Tri3Group], npt.NDArray[np.int64]]:
+        """
+        Group the Tri3 surface elements by material and stack their element constants.
+
+        Returns:
+            groups: One `_Tri3Group` per material, in order of first appearance.
+            scatter: Indices into the CSR data for the raveled (E, 3, 3) local matrices
+                     of all groups, concatenated in group order.
+        """
+        members: dict[int, list[int]] = {}
+        for i, element in enumerate(self._surface_elements):
+            members.setdefault(id(element.material), []).append(i)
+
+        # Node indices of all surface elements, in the same order as self._surface_elements
+        connectivity = self.model.mesh.connectivity()
+        node_ids = np.concatenate([connectivity[name] for name in sorted(connectivity)])
+
+        groups: list[_Tri3Group] = []
+        scatter_parts: list[npt.NDArray[np.int64]] = []
+        start = 0
+        for indices in members.values():
+            elements = [self._surface_elements[i] for i in indices]
+            stop = start + len(elements)
+            groups.append(_Tri3Group(
+                material=elements[0].material,
+                node_ids=node_ids[indices],
+                B=np.array([element.b_matrix for element in elements], dtype=np.float64),
+                det_j=np.array([element.jacobian_determinant for element in elements], dtype=np.float64),
+                local=self._tri3_local[start:stop],
+            ))
+            scatter_parts.extend(self._A_scatter[i] for i in indices)
+            start = stop
+
+        return groups, np.concatenate(scatter_parts)
+
+    def _tri3_props(self) -> list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+        """
+        Evaluate the material law at the Gauss points of every Tri3 group for the current temperatures.
+
+        Returns:
+            One (k_gp, rho_c_gp) pair per group, each of shape (E, n_gp).
+        """
+        t_nodes = self.model.mesh.node_store.current_temperature
+        return [tri3_props_at_gauss_points(t_nodes[group.node_ids], group.material) for group in self._tri3_groups]
+
+    def _assemble_tri3_batch(
+        self,
+        A: sp.sparse.csr_matrix[np.float64],
+        props: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]],
+        get_local_matrices: Callable[
+            [_Tri3Group, tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]], npt.NDArray[np.float64]
+        ]
+    ) -> sp.sparse.csr_matrix[np.float64]:
+        """
+        Assemble a global matrix from batched Tri3 local matrices.
+
+        Duplicate entries are summed by `np.bincount` into the precomputed CSR structure,
+        so there is no Python loop over the elements.
+
+        Args:
+            A: The global matrix to assemble (in CSR format).
+            props: (k_gp, rho_c_gp) of each group, as returned by `_tri3_props`.
+            get_local_matrices: Function writing the (E, 3, 3) local matrices of a group
+                                into `group.local`, given the group's (k_gp, rho_c_gp).
+
+        Returns:
+            The assembled global matrix in CSR format.
+        """
+        for group, group_props in zip(self._tri3_groups, props):
+            get_local_matrices(group, group_props)
+        A.data[:] = np.bincount(self._tri3_scatter, weights=self._tri3_local.ravel(), minlength=A.data.size)
+        return A
+
     def _assemble_global_matrix_fast(
         self,
         A: sp.sparse.csr_matrix[np.float64],
@@ -152,50 +247,38 @@ class Solver:
             A.data[scatter_list[i]] += Ke.ravel(order="C")
         return A
 
-    def _assemble_global_matrix(
-        self,
-        get_local_matrix: Callable[[FiniteElement], npt.NDArray[np.float64]]
-    ) -> sp.sparse.coo_matrix[np.float64]:
+    def assemble_global_matrices(self) -> None:
         """
-        Assemble a global matrix in CSR form for the model using a provided function to get the element matrix.
-
-        Args:
-            get_local_matrix:
-
-        Returns:
+        Assemble the global conductivity [K] and capacity [C] matrices for the model.
 
+        Both matrices are built from the same temperatures, so for Tri3 meshes the material
+        law is evaluated only once per step and shared by K and C.
         """
-        row: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
-        col: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
-        data: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
-
-        for elements in self.model.mesh.elements.values():
-            for element in elements:
-                dofs = element.global_dofs
-                n_dofs = len(dofs)
-
-                m_el = get_local_matrix(element)
+        tri3_props = self._tri3_props() if self._tri3_batch else None
+        self.assemble_global_conductivity_matrix(tri3_props=tri3_props)
+        self.assemble_global_capacity_matrix(tri3_props=tri3_props)
 
-                r = np.repeat(dofs, n_dofs)
-                c = np.tile(dofs, n_dofs)
-
-                row = np.hstack((row, r))
-                col = np.hstack((col, c))
-                data = np.hstack((data, m_el.flatten()))
-
-        return sp.sparse.coo_matrix(
-            (data, (row, col)),
-            shape=(self.model.number_of_equations, self.model.number_of_equations)
-        ).tocsr()
-
-
-    def assemble_global_conductivity_matrix(self) -> None:
+    def assemble_global_conductivity_matrix(
+        self,
+        tri3_props: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] | None = None
+    ) -> None:
         """
         Assemble the global conductivity matrix [K] for the model.
+
+        Args:
+            tri3_props: Optional material properties of the Tri3 groups from `_tri3_props`,
+                        evaluated here if not given.
         """
-        # self.model.k_global = self._assemble_global_matrix(
-        #     get_local_matrix=lambda element: element.get_conductivity_matrix()
-        # )
+        if self._tri3_batch:
+            self.model.k_global = self._assemble_tri3_batch(
+                A=self._K,
+                props=tri3_props if tri3_props is not None else self._tri3_props(),
+                get_local_matrices=lambda group, props: tri3_conductivity_batch(
+                    group.B, group.det_j, props[0], out=group.local
+                )
+            )
+            return
+
         self.model.k_global = self._assemble_global_matrix_fast(
             A=self._K,
             elements=self._surface_elements,
@@ -204,13 +287,27 @@ class Solver:
         )
 
 
-    def assemble_global_capacity_matrix(self) -> None:
+    def assemble_global_capacity_matrix(
+        self,
+        tri3_props: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] | None = None
+    ) -> None:
         """
         Assemble the global capacity matrix [C] for the model.
+
+        Args:
+            tri3_props: Optional material properties of the Tri3 groups from `_tri3_props`,
+                        evaluated here if not given.
         """
-        # self.model.c_global = self._assemble_global_matrix(
-        #     get_local_matrix=lambda element: element.get_capacity_matrix()
-        # )
+        if self._tri3_batch:
+            self.model.c_global = self._assemble_tri3_batch(
+                A=self._C,
+                props=tri3_props if tri3_props is not None else self._tri3_props(),
+                get_local_matrices=lambda group, props: tri3_capacity_batch(
+                    group.det_j, props[1], out=group.local
+                )
+            )
+            return
+
         self.model.c_global = self._assemble_global_matrix_fast(
             A=self._C,
             elements=self._surface_elements,
@@ -219,48 +316,27 @@ class Solver:
         )
 
     def assemble_load_vector(self, time: float) -> None:
-        # # q_global can be dense, because it's just length of number_of_equations
-        # self.model.q_global = np.zeros((self.model.number_of_equations,), dtype=np.float64)
-        #
-        # # dqdT_global have to be sparse, because it's number_of_equations x number_of_equations
-        # row: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
-        # col: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
-        # data: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
-        #
-        # # self.model.dqdT_global = np.zeros((self.model.number_of_equations, self.model.number_of_equations), dtype=np.float64)
-        # temperature = self.model.fire_curve.get_temperature(time=time)
-        # for elements in self.model.mesh.boundary_elements.values():
-        #     for element in elements:
-        #         dofs = element.global_dofs
-        #         n_dofs = len(dofs)
-        #
-        #         self.model.q_global[dofs] += element.get_load_vector(temperature=temperature)
-        #
-        #         # accumulate dqdT_el into global sparse triplets
-        #         # (COO tolerates duplicates; .tocsr() will sum them)
-        #         r = np.repeat(dofs, n_dofs)
-        #         c = np.tile(dofs, n_dofs)
-        #
-        #         row = np.hstack((row, r))
-        #         col = np.hstack((col, c))
-        #         data = np.hstack((data, element.get_load_vector_tangent().flatten()))
-        #
-        #         # assemble_subarray_at_indices(
-        #         #     array=self.model.dqdT_global,
-        #         #     subarray=element.get_load_vector_tangent(),
-        #         #     indices=dofs
-        #         # )
-        #
-        # # finalize dqdT_global as sparse matrix
-        # self.model.dqdT_global = sp.sparse.coo_matrix(
-        #     (data, (row, col)),
-        #     shape=(self.model.number_of_equations, self.model.number_of_equations),
-        #     dtype=np.float64
-        # ).tocsr()
-        F = np.zeros((self.neq,), dtype=np.float64)
+        F = self._F
         T = self._dqdT
-        T.data[:] = 0.0
 
+        if self._line2_batch:
+            t_f = np.array([element.get_temperature(time=time) for element in self._boundary_elements], dtype=np.float64)
+            f_e, df_e = line2_loads_batch(
+                edges_coords=self._edges_coords,
+                edges_node_ids=self._edges_node_ids,
+                t_nodes=self.model.mesh.node_store.current_temperature,
+                t_f=t_f,
+                out=(self._edges_f, self._edges_df),
+            )
+            F[:] = np.bincount(self._edges_node_ids.ravel(), weights=f_e.ravel(), minlength=self.neq)
+            T.data[:] = np.bincount(self._edges_scatter, weights=df_e.ravel(), minlength=T.data.size)
+
+            self.model.q_global = F
+            self.model.dqdT_global = T
+            return
+
+        F.fill(0.0)
+        T.data[:] = 0.0
         for i, element in enumerate(self._boundary_elements):
             temperature = element.get_temperature(time=time)
             dofs = element.global_dofs
@@ -312,8 +388,7 @@ class Solver:
             temp_new = temp_old.copy()  # Initialize the next temperature vector
 
             # Assemble global matrices for this iteration
-            self.assemble_global_conductivity_matrix()
-            self.assemble_global_capacity_matrix()
+            self.assemble_global_matrices()
             self.assemble_load_vector(time=current_time)
 
             K = self.model.k_global
@@ -369,8 +444,12 @@ class Solver:
             self.model.t_global = temp_new.copy()
 
             # assemble temperature to nodes
-            for i, node in enumerate(self.model.mesh.nodes):
-                node.current_temperature = temp_new[i]
+            node_store = self.model.mesh.node_store
+            if node_store is not None:
+                node_store.current_temperature[:] = temp_new
+            else:
+                for i, node in enumerate(self.model.mesh.nodes):
+                    node.current_temperature = temp_new[i]
 
             for i, node in enumerate(self.model.mesh.thermocouples.values()):
                 node.temperature_history = np.append(node.temperature_history, temp_new[node.uid])
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
+import scipy as sp
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -55,6 +56,42 @@ def assemble_subarray_at_indices(
     # Assemble values using indexing
     array[rows, cols] += subarray.flatten()
 
+def csr_pattern_and_scatter(
+    rows: npt.NDArray[np.int64],
+    cols: npt.NDArray[np.int64],
+    shape: tuple[int, int],
+) -> tuple[sp.sparse.csr_matrix, npt.NDArray[np.int64]]:
+    """
+    Build the CSR structure of a matrix given by COO indices, and the position of each COO entry in it.
+
+    Duplicate (row, col) pairs share one CSR entry, so a matrix with the same pattern is assembled
+    by ``A.data[:] = np.bincount(scatter, weights=values, minlength=A.data.size)`` without
+    converting COO to CSR again.
+
+    Args:
+        rows: COO row indices.
+        cols: COO column indices.
+        shape: Shape of the matrix.
+
+    Returns:
+        A: csr_matrix with sorted indices and zero float64 data.
+        scatter: For each COO entry, the index into ``A.data`` it adds to.
+    """
+    n_rows, n_cols = shape
+    keys = rows.astype(np.int64) * n_cols + cols
+
+    # Sorted unique keys are exactly the CSR entries in row-major order
+    unique_keys, scatter = np.unique(keys, return_inverse=True)
+
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(unique_keys // n_cols, minlength=n_rows), out=indptr[1:])
+
+    A = sp.sparse.csr_matrix(
+        (np.zeros(unique_keys.size, dtype=np.float64), unique_keys % n_cols, indptr),
+        shape=shape
+    )
+    return A, scatter.ravel()
+
 def flatten_groups_in_order(groups: dict[str, list]) -> list:
     """Deterministic flatten of dict-of-lists (sorted by key)."""
     out: list = []
@@ -33,7 +33,7 @@ if TYPE_CHECKING:
 # Get logger
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class MeshStats:
     """Return object containing mesh metadata."""
     filepath: str
@@ -109,8 +109,12 @@ class GmshMesher:
             gmsh.option.setNumber("Mesh.MshFileVersion", 2.2)
 
             # 2. Get the geometry loop
+            # The profile is resolved once for the loop and the rebar points; for custom shapes
+            # every resolution builds a new profile from the parameters
+            profile = project.geometry.get_resolved_profile()
             loop = self._get_boundary_loop(
                 project=project,
+                profile=profile,
                 assume_symmetric=True,
                 num_points=project.thermocouple_count
             )
@@ -165,6 +169,7 @@ class GmshMesher:
             # Generate points for rebar thermocouples
             rebar_pts = self._get_rebar_points(
                 project=project,
+                profile=profile,
                 assume_symmetric=True,
                 num_points=project.thermocouple_count
             )
@@ -294,16 +299,16 @@ class GmshMesher:
     @staticmethod
     def _get_boundary_loop(
         project: ProjectState,
+        profile: Optional[TunnelProfile],
         assume_symmetric: bool = True,
         num_points: Optional[int] = None,
     ) -> Optional[BoundaryLoop]:
         """
-        Returns the boundary loop from the project geometry state.
+        Returns the boundary loop of the resolved profile of the project geometry state.
         """
         geo = project.geometry
 
-        # 1. Get the profile
-        profile = geo.get_resolved_profile()
+        # 1. Check the profile
         if not profile:
             return None
 
@@ -323,16 +328,16 @@ class GmshMesher:
     @staticmethod
     def _get_rebar_points(
         project: ProjectState,
+        profile: Optional[TunnelProfile],
         assume_symmetric: bool = True,
         num_points: Optional[int] = None,
     ) -> list[Point]:
         """
-        Returns the points from the project geometry state.
+        Returns the rebar points of the resolved profile of the project geometry state.
         """
         geo = project.geometry
 
-        # 1. Get the profile
-        profile = geo.get_resolved_profile()
+        # 1. Check the profile
         if not profile:
             return []
 
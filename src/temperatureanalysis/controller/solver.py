@@ -158,8 +158,15 @@ class SolverWorker(QThread):
             dt = self.project.time_step  # time step in seconds
 
             # ---- Progress callback ----
+            last_percentage = -1
+
             def progress_callback(percentage: int) -> None:
+                nonlocal last_percentage
                 percentage = min(percentage, 98) # Cap at 99% until done
+                # Many time steps map to the same percentage; repaint the UI only when it changes
+                if percentage == last_percentage:
+                    return
+                last_percentage = percentage
                 msg = f"Probíhá výpočet... {percentage}% dokončeno."
                 self.progress_updated.emit(percentage, msg)
 
@@ -7,6 +7,25 @@ import sys
 from typing import Optional
 
 
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp for all records within the same second.
+
+    The date format has no sub-second fields, so strftime only needs to run once per second.
+    """
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+        self._last_second: int = -1
+        self._last_asctime: str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_asctime = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_asctime
+
+
 def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None) -> None:
     """
     Configures the root logger for the 'temperatureanalysis' namespace.
@@ -28,7 +47,7 @@ def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None) ->
     console_handler.setLevel(level)
 
     # Format: Time - Module - Level - Message
-    formatter = logging.Formatter(
+    formatter = _SecondCachedFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%H:%M:%S'
     )
@@ -13,9 +13,12 @@ It acts as the "Dependency Injection" root. It:
 4. Prevents circular import errors by being the orchestrator.
 """
 import logging
+import os
 import sys
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTranslator, QLibraryInfo
+import pyqtgraph as pg
 
 from temperatureanalysis.logging_config import setup_logging
 from temperatureanalysis.model.state import ProjectState
@@ -41,19 +44,28 @@ def main() -> None:
         if translator.load("qtbase_cs", translations_path + "/Qt6"):
             app.installTranslator(translator)
 
-    # 4. Initialize the Data Model
+    # 4. Configure pyqtgraph once, before any plot is created: all plots are drawn black on white,
+    # without antialiasing, and pyqtgraph's array conversions use the numba kernels
+    pg.setConfigOptions(antialias=False, useNumba=True, background='w', foreground='k')
+
+    # 5. Initialize the Data Model
     project = ProjectState()
 
-    # 5. Initialize the Main Window, passing the model
+    # 6. Initialize the Main Window, passing the model
     window = MainWindow(project)
     window.show()
 
-    # 6. Start Event Loop
+    # 7. Start Event Loop
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
+    # Profiling is opt-in so that the regular entry point runs without the profiler hook
+    if os.environ.get("TA_PROFILE"):
+        import cProfile
+        cProfile.run("main()", filename="profile.prof")
+    else:
+        main()
 
 
 # from temperatureanalysis.dev import timer
@@ -114,13 +126,6 @@ if __name__ == "__main__":
 #
 # if __name__ == "__main__":
 #     # main()
-#     # cProfile.run("main()", filename="profile.prof")
-#     # #
-#     # Load and inspect the stats
-#     # stats = pstats.Stats("profile.prof")
-#     # # stats.strip_dirs()  # remove extraneous path info
-#     # stats.sort_stats("tottime")  # sort by total time spent in function
-#     # stats.print_stats(50)  # show top 50 slowest functions
 #
 #     import pyvista as pv
 #
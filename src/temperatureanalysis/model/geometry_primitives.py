@@ -10,6 +10,9 @@ import math
 if TYPE_CHECKING:
     import numpy.typing as npt
 
+# Angular step of Arc.discretize() when no point count is given; ~1.5 mm chord error at 10 m radius
+ARC_ANGLE_STEP = math.radians(2.0)
+
 @dataclass
 class Vector:
     """
@@ -194,25 +197,22 @@ class Arc:
         """
         Generates points along the arc from `start` to `end` via `center`.
         Handles the 'shortest path' logic standard in CAD kernels.
-        """
-        if num_points is not None:
-            resolution = max(2, num_points)  # Ensure at least 2 points
-        else:
-            resolution = 100
 
-        p_s = self.start.to_array()
-        p_e = self.end.to_array()
-        p_c = self.center.to_array()
+        Without `num_points`, the number of points follows the swept angle (one per ARC_ANGLE_STEP),
+        so short arcs are not discretized as finely as half circles.
+        """
+        # The per-arc quantities are scalars; plain math avoids building small numpy arrays
+        cx, cy = self.center.x, self.center.y
 
         # Vectors from center
-        v_s = p_s - p_c
-        v_e = p_e - p_c
+        v_s = self.start - self.center
+        v_e = self.end - self.center
 
-        radius = np.linalg.norm(v_s)
+        radius = v_s.magnitude
 
         # Angles in global frame (-pi, pi)
-        ang_s = np.arctan2(v_s[1], v_s[0])
-        ang_e = np.arctan2(v_e[1], v_e[0])
+        ang_s = math.atan2(v_s.y, v_s.x)
+        ang_e = math.atan2(v_e.y, v_e.x)
 
         # Calculate angular difference
         diff = ang_e - ang_s
@@ -220,18 +220,30 @@ class Arc:
         # Normalize diff to (-pi, pi) for shortest path logic
         # Iff diff > pi, we should go the other way (subtract 2pi)
         # Iff diff < -pi, add 2pi
-        while diff <= -np.pi:
-            diff += 2 * np.pi
-        while diff > np.pi:
-            diff -= 2 * np.pi
+        while diff <= -math.pi:
+            diff += math.tau
+        while diff > math.pi:
+            diff -= math.tau
 
-        angles = np.linspace(ang_s, ang_s + diff, resolution)
+        if num_points is not None:
+            resolution = max(2, num_points)  # Ensure at least 2 points
+        else:
+            # The tolerance keeps sweeps of an exact multiple of the step from flipping on rounding noise
+            resolution = max(2, math.ceil(abs(diff) / ARC_ANGLE_STEP - 1e-9) + 1)
 
-        x = p_c[0] + radius * np.cos(angles)
-        y = p_c[1] + radius * np.sin(angles)
-        z = np.zeros_like(x)
+        angles = np.linspace(ang_s, ang_s + diff, resolution)
 
-        return np.array([x, y, z]).T
+        # Write x and y straight into the columns of the result, z stays 0
+        points = np.zeros((resolution, 3), dtype=np.float64)
+        x, y = points[:, 0], points[:, 1]
+        np.cos(angles, out=x)
+        x *= radius
+        x += cx
+        np.sin(angles, out=y)
+        y *= radius
+        y += cy
+
+        return points
 
     def divide(
         self,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from math import sqrt, pi
+from math import atan2, sqrt, pi, tau
 import numpy as np
 
 if TYPE_CHECKING:
@@ -10,6 +11,9 @@ if TYPE_CHECKING:
 
 from temperatureanalysis.model.geometry_primitives import Point, Vector, Circle
 
+# Number of distinct polylines kept by the memoized discretization helpers
+POLYLINE_CACHE_SIZE = 128
+
 def deg2rad(degrees: float) -> float:
     return degrees * pi / 180
 
@@ -26,6 +30,7 @@ def circle_to_polyline(
 
     Returns:
         An array of shape (n, 2) containing the (x, y) coordinates of the points along the circle.
+        The array is cached and read-only, copy it before modifying.
     """
     return ellipse_to_polyline(circle.center, circle.radius, circle.radius, n_segments)
 
@@ -46,14 +51,35 @@ def ellipse_to_polyline(
 
     Returns:
         An array of shape (n, 2) containing the (x, y) coordinates of the points along the ellipse.
+        The array is cached and read-only, copy it before modifying.
     """
+    return _ellipse_points(float(center.x), float(center.y), float(a), float(b), int(n_segments))
+
+
+@lru_cache(maxsize=POLYLINE_CACHE_SIZE)
+def _ellipse_points(cx: float, cy: float, a: float, b: float, n_segments: int) -> np.ndarray:
+    """Memoized body of `ellipse_to_polyline`, keyed on plain scalars."""
     theta = np.linspace(0.0, 2.0 * np.pi, n_segments, endpoint=False)
-    pts = np.c_[center.x + a * np.cos(theta), center.y + b * np.sin(theta)]
+
+    # With endpoint=False the last angle never repeats the first, so any ring of 2+ points gets a
+    # closing row; it is reserved up front instead of appended afterwards
+    closed = n_segments > 1
+    pts = np.empty((n_segments + closed, 2), dtype=np.float64)
+
+    # Write x and y straight into the columns of the result, no temporaries
+    x, y = pts[:n_segments, 0], pts[:n_segments, 1]
+    np.cos(theta, out=x)
+    x *= a
+    x += cx
+    np.sin(theta, out=y)
+    y *= b
+    y += cy
 
     # close the ring
-    if not np.allclose(pts[0], pts[-1]):
-        pts = np.vstack((pts, pts[0]))
+    if closed:
+        pts[-1] = pts[0]
 
+    pts.setflags(write=False)
     return pts
 
 
@@ -96,40 +122,44 @@ def line_circle_intersection(
     """
     x0, y0 = point.x, point.y
     vx, vy = vector.x, vector.y
-    cx, cy = circle.center.x, circle.center.y
+    dx, dy = x0 - circle.center.x, y0 - circle.center.y
     r = circle.radius
     a = vx * vx + vy * vy
+    c = dx * dx + dy * dy - r * r
 
     # degenerate direction: treat as point-circle intersection
     if abs(a) < eps:
-        on_circle = abs((x0 - cx) ** 2 + (y0 - cy) ** 2 - r ** 2) <= eps
-        return [(x0, y0)] if on_circle else []
+        return [Point(x=x0, y=y0)] if abs(c) <= eps else []
 
-    b = 2.0 * (vx * (x0 - cx) + vy * (y0 - cy))
-    c = (x0 - cx) ** 2 + (y0 - cy) ** 2 - r * r
-    disc = b * b - 4.0 * a * c
+    # Reduced form with h = b / 2: t = (-h ± sqrt(h² - a c)) / a. The discriminant is
+    # a quarter of b² - 4ac, so it is compared against eps / 4 to keep the same tolerance.
+    h = vx * dx + vy * dy
+    disc = h * h - a * c
+    disc_eps = 0.25 * eps
 
     # No real intersection
-    if disc < -eps:
+    if disc < -disc_eps:
         return []
 
+    inv_a = 1.0 / a
+
     # One or two intersection
-    if abs(disc) <= eps:
-        t = -b / (2.0 * a)
+    if abs(disc) <= disc_eps:
+        t = -h * inv_a
 
         if as_segment and not (0.0 - eps <= t <= 1.0 + eps):
             return []
         return [Point(x=x0+t*vx, y=y0+t*vy)]
 
-    sqrt_disc = sqrt(max(0.0, disc))
-    t1 = (-b - sqrt_disc) / (2.0 * a)
-    t2 = (-b + sqrt_disc) / (2.0 * a)
+    sqrt_disc = sqrt(disc)
 
-    ts = [t1, t2]
-    if as_segment:
-        ts = [t for t in ts if 0.0 - eps <= t <= 1.0 + eps]
-
-    return [Point(x=x0+t*vx, y=y0+t*vy) for t in ts]
+    # Points are only built for the roots that are kept
+    points = []
+    for t in ((-h - sqrt_disc) * inv_a, (-h + sqrt_disc) * inv_a):
+        if as_segment and not (0.0 - eps <= t <= 1.0 + eps):
+            continue
+        points.append(Point(x=x0+t*vx, y=y0+t*vy))
+    return points
 
 
 def arc_points(
@@ -154,29 +184,55 @@ def arc_points(
 
     Returns:
         Array of shape (n_points, 2) containing the (x, y) coordinates of the points along the arc.
+        The array is cached and read-only, copy it before modifying.
     """
     cx, cy = C
     ax, ay = A
     bx, by = B
+    return _arc_points(
+        float(cx), float(cy), float(r), float(ax), float(ay), float(bx), float(by), bool(clockwise), int(n_points)
+    )
+
 
-    # Angles of A and B with respect to center C
-    theta_a = np.arctan2(ay - cy, ax - cx)
-    theta_b = np.arctan2(by - cy, bx - cx)
+@lru_cache(maxsize=POLYLINE_CACHE_SIZE)
+def _arc_points(
+    cx: float,
+    cy: float,
+    r: float,
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    clockwise: bool,
+    n_points: int
+) -> npt.NDArray[np.float64]:
+    """Memoized body of `arc_points`, keyed on plain scalars."""
+    # Angles of A and B with respect to center C (scalar math, no 0-d arrays)
+    theta_a = atan2(ay - cy, ax - cx)
+    theta_b = atan2(by - cy, bx - cx)
 
     if clockwise:
         if theta_b > theta_a:
-            theta_b -= 2 * np.pi
+            theta_b -= tau
     else:
         if theta_b < theta_a:
-            theta_b += 2 * np.pi
+            theta_b += tau
 
     # Generate angles
     angles = np.linspace(theta_a, theta_b, n_points)
 
-    x = cx + r * np.cos(angles)
-    y = cy + r * np.sin(angles)
-
-    return np.column_stack((x, y))
+    # Write x and y straight into the columns of the result, no temporaries
+    pts = np.empty((n_points, 2), dtype=np.float64)
+    x, y = pts[:, 0], pts[:, 1]
+    np.cos(angles, out=x)
+    x *= r
+    x += cx
+    np.sin(angles, out=y)
+    y *= r
+    y += cy
+
+    pts.setflags(write=False)
+    return pts
 
 def line_intersection(p1: Point, p2: Point, p3: Point, p4: Point, eps=1e-12):
     """
@@ -185,20 +185,17 @@ class IOManager:
                     # 1.3 Instantiate and Assign
                     if param_class_name == "BoxParams":
                         state.geometry.parameters = BoxParams(**loaded_values)
-                        state.geometry.shape_type = CustomTunnelShape.BOX
                         state.geometry.custom_shape = CustomTunnelShape.BOX
                         state.geometry.group_key = ProfileGroupKey.CUSTOM
 
                     elif param_class_name == "CircleParams":
                         state.geometry.parameters = CircleParams(**loaded_values)
-                        state.geometry.shape_type = CustomTunnelShape.CIRCLE
                         state.geometry.custom_shape = CustomTunnelShape.CIRCLE
                         state.geometry.group_key = ProfileGroupKey.CUSTOM
 
                     elif param_class_name == "PredefinedParams":
                         state.geometry.parameters = PredefinedParams(**loaded_values)
                         # Correctly map to PREDEFINED enum
-                        state.geometry.shape_type = None
                         state.geometry.custom_shape = None
                         state.geometry.group_key = grp_geo.attrs.get("group_key", ProfileGroupKey.VL5_ROAD)
 
@@ -7,6 +7,7 @@ These classes hold the PARAMETERS needed to initialize the FEA material classes.
 from __future__ import annotations
 
 from dataclasses import dataclass, field, asdict, InitVar
+from functools import lru_cache
 from abc import ABC, abstractmethod
 from enum import Enum, StrEnum
 from typing import List, Dict, Optional, Union, Any, TYPE_CHECKING
@@ -19,6 +20,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct concrete parameter sets whose preview curves are kept
+PREVIEW_CURVE_CACHE_SIZE = 64
+
+# Preview temperatures [°C] of the piecewise linear concrete curves, at their breakpoints.
+# Shared by all materials, hence read-only
+PREVIEW_TEMPERATURES_DENSITY = np.array([20.0, 115.0, 200.0, 400.0, 1200.0])
+PREVIEW_TEMPERATURES_SPECIFIC_HEAT = np.array([20.0, 100.0, 115.0, 200.0, 400.0, 1200.0])
+PREVIEW_TEMPERATURES_DENSITY.flags.writeable = False
+PREVIEW_TEMPERATURES_SPECIFIC_HEAT.flags.writeable = False
+
+# Moisture content [%] and the corresponding peak of the specific heat capacity above 900 J/(kg·K)
+MOISTURE_CONTENTS = np.array([0.0, 1.5, 3.0, 10.0])
+MOISTURE_PEAKS = np.array([900.0, 1470.0, 2020.0, 5600.0]) - 900.0
+
+
+def _scalar_or_array(
+    values: npt.NDArray[np.float64],
+    temperature: float | npt.NDArray[np.float64]
+) -> float | npt.NDArray[np.float64]:
+    """Return a Python float for a scalar temperature and the array otherwise."""
+    return float(values) if np.ndim(temperature) == 0 else values
+
+
 class ThermalConductivityBoundary(StrEnum):
     """Boundary selection for thermal conductivity in concrete materials."""
     LOWER = "lower"
@@ -46,11 +70,14 @@ PROPERTY_METADATA: Dict[TemperatureDependentProperty, PropertyMetadata] = {
     TemperatureDependentProperty.DENSITY: PropertyMetadata(label="Objemová hmotnost", unit="kg/m³"),
 }
 
-@dataclass
+@dataclass(slots=True)
 class MaterialProperty:
     """
     Represents a single physical property (e.g. conductivity, ...)
     of a material for GENERIC models.
+
+    The curve is kept as plain lists, which is what gets serialized and edited in the UI;
+    use `as_arrays` to hand it to numpy or plotting code.
     """
     property_type: TemperatureDependentProperty
     temperatures: List[float] = field(default_factory=list)
@@ -71,6 +98,13 @@ class MaterialProperty:
             )
         )
 
+    def as_arrays(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Return the curve as contiguous float64 (temperatures, values) arrays."""
+        return (
+            np.array(self.temperatures, dtype=np.float64),
+            np.array(self.values, dtype=np.float64)
+        )
+
     @property
     def name(self) -> str:
         return PROPERTY_METADATA[self.property_type].label
@@ -226,9 +260,7 @@ class GenericMaterial(Material):
             return np.array([]), np.array([])
 
         # Use the property's own temperatures, not conductivity's!
-        temps = np.array(prop.temperatures)
-        values = np.array(prop.values)
-        return temps, values
+        return prop.as_arrays()
 
     @classmethod
     def from_csv(cls, name: str, filepath: str) -> GenericMaterial:
@@ -293,68 +325,70 @@ class ConcreteMaterial(Material):
 
     # --- EUROCODE CALCULATION METHODS (ČSN EN 1992-1-2) ---
 
-    def _calculate_thermal_conductivity(self, temp_celsius: float) -> float:
+    def _calculate_thermal_conductivity(self, temp_celsius: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """
         Calculate thermal conductivity according to Eurocode 2.
 
         Args:
-            temp_celsius: Temperature in Celsius
+            temp_celsius: Temperature(s) in Celsius
 
         Returns:
-            Thermal conductivity in W/(m·K)
+            Thermal conductivity in W/(m·K), a float for a scalar temperature
         """
+        t = np.asarray(temp_celsius, dtype=np.float64)
+        x = t / 100.0
         if self.conductivity_boundary == ThermalConductivityBoundary.UPPER:
-            if temp_celsius <= 1200.0:
-                return 2 - 0.2451 * (temp_celsius / 100.0) + 0.0107 * (temp_celsius / 100.0) ** 2
-            return 0.5996
+            k = np.where(t <= 1200.0, 2 - 0.2451 * x + 0.0107 * x ** 2, 0.5996)
         else:  # LOWER boundary
-            if temp_celsius <= 1200.0:
-                return 1.36 - 0.136 * (temp_celsius / 100.0) + 0.0057 * (temp_celsius / 100.0) ** 2
-            return 0.5488
+            k = np.where(t <= 1200.0, 1.36 - 0.136 * x + 0.0057 * x ** 2, 0.5488)
+        return _scalar_or_array(k, temp_celsius)
 
-    def _calculate_density(self, temp_celsius: float) -> float:
+    def _calculate_density(self, temp_celsius: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """
         Calculate density according to Eurocode 2.
 
         Args:
-            temp_celsius: Temperature in Celsius
+            temp_celsius: Temperature(s) in Celsius
 
         Returns:
-            Density in kg/m³
+            Density in kg/m³, a float for a scalar temperature
         """
-        if temp_celsius <= 115.0:
-            return self.initial_density
-        if temp_celsius <= 200.0:
-            return self.initial_density * (1 - 0.02 * (temp_celsius - 115.0) / 85.0)
-        if temp_celsius <= 400.0:
-            return self.initial_density * (0.98 - 0.03 * (temp_celsius - 200.0) / 200.0)
-        return self.initial_density * (0.95 - 0.07 * (temp_celsius - 400.0) / 800.0)
-
-    def _calculate_specific_heat(self, temp_celsius: float) -> float:
+        t = np.asarray(temp_celsius, dtype=np.float64)
+        factor = np.select(
+            [t <= 115.0, t <= 200.0, t <= 400.0],
+            [
+                1.0,
+                1 - 0.02 * (t - 115.0) / 85.0,
+                0.98 - 0.03 * (t - 200.0) / 200.0,
+            ],
+            default=0.95 - 0.07 * (t - 400.0) / 800.0,
+        )
+        return _scalar_or_array(self.initial_density * factor, temp_celsius)
+
+    def _calculate_specific_heat(self, temp_celsius: float | npt.NDArray[np.float64]) -> float | npt.NDArray[np.float64]:
         """
         Calculate specific heat capacity according to Eurocode 2.
 
         Args:
-            temp_celsius: Temperature in Celsius
+            temp_celsius: Temperature(s) in Celsius
 
         Returns:
-            Specific heat capacity in J/(kg·K)
+            Specific heat capacity in J/(kg·K), a float for a scalar temperature
         """
-        # Moisture bump for specific heat capacity
-        u_V = np.array([0.0, 1.5, 3.0, 10.0])
-        d_V = np.array([900.0, 1470.0, 2020.0, 5600.0]) - 900.0
-        d = float(np.interp(self.initial_moisture_content, u_V, d_V))  # moisture bump
-
-        if temp_celsius <= 100.0:
-            return 900.0
-        if temp_celsius <= 115.0:
-            return 900.0 + d
-        if temp_celsius <= 200.0:
-            return 900.0 + d - ((900.0 + d - 1000.0) / 85.0) * (temp_celsius - 115.0)
-        if temp_celsius <= 400.0:
-            return 1000.0 + (temp_celsius - 200.0) / 2.0
-        # else:
-        return 1100.0
+        t = np.asarray(temp_celsius, dtype=np.float64)
+        d = float(np.interp(self.initial_moisture_content, MOISTURE_CONTENTS, MOISTURE_PEAKS))  # moisture bump
+
+        c_p = np.select(
+            [t <= 100.0, t <= 115.0, t <= 200.0, t <= 400.0],
+            [
+                900.0,
+                900.0 + d,
+                900.0 + d - ((900.0 + d - 1000.0) / 85.0) * (t - 115.0),
+                1000.0 + (t - 200.0) / 2.0,
+            ],
+            default=1100.0,
+        )
+        return _scalar_or_array(c_p, temp_celsius)
 
     def get_preview_curve(
         self,
@@ -365,23 +399,77 @@ class ConcreteMaterial(Material):
     ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         """
         Generate preview curve for plotting in the UI.
-        Uses Eurocode 2 (ČSN EN 1992-1-2) formulas.
+        Uses Eurocode 2 (ČSN EN 1992-1-2) formulas, evaluated for all temperatures at once.
+
+        The curves are memoized on the one parameter each depends on (density on the initial
+        density, specific heat on the moisture content, conductivity on the boundary), so editing
+        the other parameters returns the very same arrays. They are shared and read-only, copy
+        them before modifying.
         """
+        # Parameters a curve does not depend on are replaced by the defaults to share cache entries;
+        # only the conductivity curve is sampled on a grid of `steps` temperatures
+        density = ConcreteConfig.initial_density
+        moisture = ConcreteConfig.initial_moisture_content
+        boundary = ConcreteConfig.conductivity_boundary
         if property_name == TemperatureDependentProperty.CONDUCTIVITY:
-            temps_celsius = np.linspace(20, 1200, num=steps)
-            vals = np.array([self._calculate_thermal_conductivity(t) for t in temps_celsius])
+            boundary = self.conductivity_boundary
+        else:
+            steps = 0
+            if property_name == TemperatureDependentProperty.DENSITY:
+                density = self.initial_density
+            elif property_name == TemperatureDependentProperty.SPECIFIC_HEAT_CAPACITY:
+                moisture = self.initial_moisture_content
+
+        return _concrete_preview_curve(property_name, density, moisture, boundary, steps)
+
+    def _evaluate_preview_curve(
+        self,
+        property_name: TemperatureDependentProperty,
+        steps: int
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Uncached body of `get_preview_curve`."""
+        if property_name == TemperatureDependentProperty.CONDUCTIVITY:
+            temps_celsius = _conductivity_preview_temperatures(steps)
+            vals = self._calculate_thermal_conductivity(temps_celsius)
         elif property_name == TemperatureDependentProperty.DENSITY:
-            temps_celsius = np.array([20, 115, 200, 400, 1200])
-            vals = np.array([self._calculate_density(t) for t in temps_celsius])
+            temps_celsius = PREVIEW_TEMPERATURES_DENSITY
+            vals = self._calculate_density(temps_celsius)
         elif property_name == TemperatureDependentProperty.SPECIFIC_HEAT_CAPACITY:
-            temps_celsius = np.array([20, 100, 115, 200, 400, 1200])
-            vals = np.array([self._calculate_specific_heat(t) for t in temps_celsius])
+            temps_celsius = PREVIEW_TEMPERATURES_SPECIFIC_HEAT
+            vals = self._calculate_specific_heat(temps_celsius)
         else:
             raise ValueError(f"Unknown property: {property_name}")
 
         return (temps_celsius, vals)
 
 
+@lru_cache(maxsize=8)
+def _conductivity_preview_temperatures(steps: int) -> npt.NDArray[np.float64]:
+    """Read-only grid of `steps` temperatures [°C] for the concrete conductivity preview."""
+    temps_celsius = np.linspace(20.0, 1200.0, num=steps)
+    temps_celsius.flags.writeable = False
+    return temps_celsius
+
+
+@lru_cache(maxsize=PREVIEW_CURVE_CACHE_SIZE)
+def _concrete_preview_curve(
+    property_name: TemperatureDependentProperty,
+    initial_density: float,
+    initial_moisture_content: float,
+    conductivity_boundary: ThermalConductivityBoundary,
+    steps: int
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Memoized body of `ConcreteMaterial.get_preview_curve`, keyed on the parameters the curves depend on."""
+    material = ConcreteMaterial(
+        name="",
+        initial_density=initial_density,
+        initial_moisture_content=initial_moisture_content,
+        conductivity_boundary=conductivity_boundary
+    )
+    temps_celsius, vals = material._evaluate_preview_curve(property_name, steps)
+    vals.flags.writeable = False
+    return temps_celsius, vals
+
 
 class MaterialLibrary:
     """
@@ -34,21 +34,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BoxParams:
     width: float = 8.0
     height: float = 5.0
     thickness: float = 0.5
     rebar_depth: float = 0.1  # Distance from inner surface to rebar center [m]
 
-@dataclass
+@dataclass(slots=True)
 class CircleParams:
     radius: float = 6.0
     center_y: float = 4.0
     thickness: float = 0.5
     rebar_depth: float = 0.1  # Distance from inner surface to rebar center [m]
 
-@dataclass
+@dataclass(slots=True)
 class PredefinedParams:
     profile_name: str = "Tunel T-7,5, ražený"
     thickness: float = 0.4
@@ -57,7 +57,7 @@ class PredefinedParams:
 # Union for type hinting
 GeometryParams = Union[BoxParams, CircleParams, PredefinedParams]
 
-@dataclass
+@dataclass(slots=True)
 class GeometryData:
     """
     Holds the geometry configuration.
@@ -148,7 +148,7 @@ class GeometryData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectState:
     """
     Singleton-like class that holds the entire state of the open project.
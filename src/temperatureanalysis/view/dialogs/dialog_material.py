@@ -17,7 +17,7 @@ from PySide6.QtWidgets import (
     QLineEdit, QFileDialog, QMessageBox, QDoubleSpinBox,
     QComboBox, QStackedWidget, QSizePolicy, QDialogButtonBox
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Signal, QTimer
 
 from temperatureanalysis.model.materials import (
     Material, MaterialLibrary, MaterialType, ThermalConductivityBoundary,
@@ -27,6 +27,24 @@ from temperatureanalysis.model.materials import (
 
 logger = logging.getLogger(__name__)
 
+# PyOpenGL is optional. With it, the material plots render through an OpenGL viewport, where
+# pyqtgraph draws the curves directly instead of rebuilding a QPainterPath on every redraw
+try:
+    import OpenGL.GL  # noqa: F401
+    PLOT_USE_OPENGL = True
+except ImportError:
+    PLOT_USE_OPENGL = False
+
+if PLOT_USE_OPENGL:
+    # Only affects views with an OpenGL viewport, the other plots keep the raster painter
+    pg.setConfigOption('enableExperimental', True)
+
+# Order of the plot tabs and the tab index of each property, for syncing them with the editor tabs
+PROPERTY_KEYS = tuple(PROPERTY_METADATA)
+PROPERTY_TAB_INDEX = {prop: i for i, prop in enumerate(PROPERTY_KEYS)}
+
+PLOT_DEBOUNCE_MS = 75  # Coalesce bursts of editor changes into a single plot redraw
+
 # ==============================================================================
 # CSV IMPORT DIALOG
 # ==============================================================================
@@ -713,16 +731,22 @@ class MaterialsDialog(QDialog):
         self.current_material = None
         self.active_prop_key = TemperatureDependentProperty.CONDUCTIVITY
 
-        # Store plotting widgets for tabs
+        # Store plotting widgets for tabs, their curve items and the arrays last drawn into them
         self.plot_widgets: dict[TemperatureDependentProperty, pg.PlotWidget] = {}
+        self.plot_curves: dict[TemperatureDependentProperty, pg.PlotDataItem] = {}
+        self._plotted_data: dict[TemperatureDependentProperty, tuple] = {}
 
-        self._init_ui()
-        self._refresh_list()
+        # Editors update the material immediately, the plot is redrawn once the edits stop,
+        # e.g. after holding a spin box arrow
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setSingleShot(True)
+        self._plot_timer.setInterval(PLOT_DEBOUNCE_MS)
+        self._plot_timer.timeout.connect(self._update_plot)
 
-        if self.project.selected_material:
-            items = self.list_widget.findItems(self.project.selected_material.name, Qt.MatchExactly)
-            if items:
-                self.list_widget.setCurrentItem(items[0])
+        self._init_ui()
+        # Start on the project's material directly, instead of loading the first one and switching
+        selected = self.project.selected_material
+        self._refresh_list(select_name=selected.name if selected else None)
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -788,13 +812,13 @@ class MaterialsDialog(QDialog):
 
         # Editor 1: Generic
         self.editor_generic = GenericMaterialEditor()
-        self.editor_generic.dataChanged.connect(self._update_plot)
+        self.editor_generic.dataChanged.connect(self._plot_timer.start)
         self.editor_generic.activePropertyChanged.connect(self._on_generic_tab_changed)
         self.stack.addWidget(self.editor_generic)
 
         # Editor 2: Concrete
         self.editor_concrete = ConcreteMaterialEditor()
-        self.editor_concrete.dataChanged.connect(self._update_plot)
+        self.editor_concrete.dataChanged.connect(self._plot_timer.start)
         self.stack.addWidget(self.editor_concrete)
 
         center_layout.addWidget(self.stack)
@@ -807,13 +831,26 @@ class MaterialsDialog(QDialog):
             meta = PROPERTY_METADATA[prop]
 
             # Create Plot Widget
-            plot = pg.PlotWidget()
-            plot.setBackground('w')
+            # Background and axis colours come from the global pyqtgraph config, see main.py
+            plot = pg.PlotWidget(useOpenGL=PLOT_USE_OPENGL)
             plot.showGrid(x=True, y=True)
             plot.setLabel('bottom', 'Teplota (°C)', color='black')
-            plot.getAxis('bottom').setPen('k')
-            plot.getAxis('left').setPen('k')
             plot.setTitle(meta.label, color='k')
+            # The unit of a tab never changes, so the axis is labelled once here
+            plot.setLabel('left', meta.unit)
+
+            # The plots are read-only previews, no panning or zooming that would re-render them
+            plot.setMouseEnabled(x=False, y=False)
+            plot.hideButtons()
+
+            # One curve item per plot, updated in place by _update_plot. Downsampling and clipping
+            # keep redraws cheap should the previews ever get denser
+            self.plot_curves[prop] = plot.plot(
+                pen=pg.mkPen(color=(0, 120, 215), width=2),
+                autoDownsample=True,
+                downsampleMethod='peak',
+                clipToView=True
+            )
 
             self.plot_widgets[prop] = plot
             self.plot_tabs.addTab(plot, meta.label)  # Use label for Tab Title
@@ -850,15 +887,19 @@ class MaterialsDialog(QDialog):
         # Save Working Copy -> Project
         self.project.material_library = copy.deepcopy(self.working_library)
 
-    def _refresh_list(self):
+    def _refresh_list(self, select_name: Optional[str] = None):
         curr = self.list_widget.currentRow()
+        names = self.working_library.get_names()
         self.list_widget.blockSignals(True)
         self.list_widget.clear()
-        for name in self.working_library.get_names():
+        for name in names:
             self.list_widget.addItem(name)
         self.list_widget.blockSignals(False)
         if self.list_widget.count() > 0:
-            row = curr if curr >= 0 else 0
+            if select_name in names:
+                row = names.index(select_name)
+            else:
+                row = curr if curr >= 0 else 0
             self.list_widget.setCurrentRow(row)
         else:
             self.center_group.setEnabled(False)
@@ -894,12 +935,12 @@ class MaterialsDialog(QDialog):
         if is_concrete:
             self.stack.setCurrentWidget(self.editor_concrete)
             self.editor_concrete.set_material(mat)
+            self._update_plot()
         else:
             self.stack.setCurrentWidget(self.editor_generic)
+            # Loading re-emits the editor's active tab, which syncs the plot tab and redraws
             self.editor_generic.set_material(mat)
 
-        self._update_plot()
-
     def on_type_changed(self):
         if not self.current_material: return
         new_type = self.combo_type.currentData()
@@ -924,10 +965,9 @@ class MaterialsDialog(QDialog):
         self.working_library.materials[new_mat.name] = new_mat
         self.current_material = new_mat
 
+        # Reloads the editors and redraws the plot
         self.on_selection_changed(self.list_widget.currentItem(), None)
 
-        self._update_plot()
-
     def on_name_changed(self):
         if not self.current_material: return
         if self.edit_name.isReadOnly(): return
@@ -955,7 +995,7 @@ class MaterialsDialog(QDialog):
         del self.working_library.materials[old_name]
         self.current_material.name = new_name
         self.working_library.materials[new_name] = self.current_material
-        self._refresh_list()
+        self._refresh_list(select_name=new_name)
 
     def on_desc_changed(self):
         if not self.current_material: return
@@ -972,10 +1012,7 @@ class MaterialsDialog(QDialog):
 
         new_mat = GenericMaterial(name=name)
         self.working_library.add_material(new_mat)
-        self._refresh_list()
-
-        items = self.list_widget.findItems(name, Qt.MatchExactly)
-        if items: self.list_widget.setCurrentItem(items[0])
+        self._refresh_list(select_name=name)
 
     def on_copy_clicked(self):
         """Copy the currently selected material."""
@@ -996,11 +1033,7 @@ class MaterialsDialog(QDialog):
         new_mat.name = name
 
         self.working_library.add_material(new_mat)
-        self._refresh_list()
-
-        items = self.list_widget.findItems(name, Qt.MatchExactly)
-        if items:
-            self.list_widget.setCurrentItem(items[0])
+        self._refresh_list(select_name=name)
 
     def on_delete_clicked(self):
         """Delete the currently selected material."""
@@ -1066,10 +1099,7 @@ class MaterialsDialog(QDialog):
 
             # Add to library
             self.working_library.add_material(mat)
-            self._refresh_list()
-            items = self.list_widget.findItems(mat.name, Qt.MatchExactly)
-            if items:
-                self.list_widget.setCurrentItem(items[0])
+            self._refresh_list(select_name=mat.name)
 
             QMessageBox.information(self, "Úspěch",
                                     f"Materiál '{mat.name}' byl importován s {len(data['temperatures'])} body.")
@@ -1083,7 +1113,7 @@ class MaterialsDialog(QDialog):
         # Sync Right Tab to match Editor Tab
         self.active_prop_key = prop_key
         # Find index for this property
-        idx = list(PROPERTY_METADATA.keys()).index(prop_key)
+        idx = PROPERTY_TAB_INDEX[prop_key]
         self.plot_tabs.blockSignals(True)
         self.plot_tabs.setCurrentIndex(idx)
         self.plot_tabs.blockSignals(False)
@@ -1091,9 +1121,8 @@ class MaterialsDialog(QDialog):
 
     def _on_plot_tab_changed(self, index: int):
         # Sync Editor Tab to match Right Tab
-        props = list(PROPERTY_METADATA.keys())
-        if index < len(props):
-            self.active_prop_key = props[index]
+        if index < len(PROPERTY_KEYS):
+            self.active_prop_key = PROPERTY_KEYS[index]
 
             # If Generic Editor is active, switch its tab too
             if isinstance(self.current_material, GenericMaterial):
@@ -1104,24 +1133,30 @@ class MaterialsDialog(QDialog):
             self._update_plot()
 
     def _update_plot(self):
+        # A direct redraw supersedes any pending debounced one
+        self._plot_timer.stop()
         if not self.current_material: return
 
         prop_key = self.active_prop_key
         plot = self.plot_widgets[prop_key]
 
-        meta = PROPERTY_METADATA[prop_key]
-        plot.setLabel('left', meta.unit)
-
         # Fetch Data
         temps, values = self.current_material.get_preview_curve(prop_key)
 
-        logger.info(f"Updating plot for {self.current_material.name} - {prop_key.name}: {len(temps)} point.")
-
-        plot.clear()
+        # Memoized curves come back as the very same arrays, nothing to redraw then
+        last = self._plotted_data.get(prop_key)
+        if last is not None and last[0] is temps and last[1] is values:
+            return
+        self._plotted_data[prop_key] = (temps, values)
 
-        pen = pg.mkPen(color=(0, 120, 215), width=2)
-        plot.plot(temps, values, pen=pen)
+        logger.info(f"Updating plot for {self.current_material.name} - {prop_key.name}: {len(temps)} point.")
 
-        max_val = max(values)
+        # The Eurocode curves are finite by construction, so pyqtgraph can skip scanning x and y
+        # for NaN/inf; tabulated curves typed in by the user keep the check
+        finite = isinstance(self.current_material, ConcreteMaterial)
+        self.plot_curves[prop_key].setData(
+            temps, values, connect='all' if finite else 'auto', skipFiniteCheck=finite
+        )
 
-        plot.setYRange(0, max_val)
+        if len(values):
+            plot.setYRange(0, max(values))
@@ -88,6 +88,8 @@ class ClickableLogoLabel(QLabel):
         self.url = url
         self.setCursor(Qt.PointingHandCursor)
         self._original_pixmap = None
+        # Width the shown pixmap was scaled to; height-only resizes need no smooth rescale
+        self._scaled_width = 0
 
         # Allow label to scale
         self.setMinimumWidth(1)
@@ -97,6 +99,7 @@ class ClickableLogoLabel(QLabel):
     def set_source_pixmap(self, pixmap):
         """Set the source pixmap that will be scaled."""
         self._original_pixmap = pixmap
+        self._scaled_width = 0
         if pixmap is None:
             self.clear()
         else:
@@ -112,9 +115,10 @@ class ClickableLogoLabel(QLabel):
         """Scale pixmap to current widget width while maintaining aspect ratio."""
         if self._original_pixmap and not self._original_pixmap.isNull():
             w = self.width()
-            if w > 0:
+            if w > 0 and w != self._scaled_width:
                 scaled = self._original_pixmap.scaledToWidth(w, Qt.SmoothTransformation)
                 super().setPixmap(scaled)
+                self._scaled_width = w
 
     def mousePressEvent(self, event):
         """Handle mouse click to open URL."""
@@ -127,6 +131,10 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.project: ProjectState = project_state
         self.is_modified: bool = True
+        # (results list, min, max) in Kelvin; the list is replaced, never mutated, on a new run
+        self._results_range: tuple[list, float, float] | None = None
+        # str() of the geometry the current mesh was generated from (None without a mesh)
+        self._meshed_geometry: str | None = None
 
         self.update_window_title()
         self.resize(1400, 900)
@@ -205,6 +213,8 @@ class MainWindow(QMainWindow):
         # --- SIGNAL CONNECTIONS ---
         # 1. Link Tab Bar to Stacked Widget
         self.tab_bar.currentChanged.connect(self.controls_stack.setCurrentIndex)
+        # Apply debounced geometry edits before another tab (e.g. meshing) can act on them
+        self.tab_bar.currentChanged.connect(lambda _: self.geom_panel.flush_pending_changes())
 
         # 1. Geometry Changed -> Invalidate Mesh + Update View
         self.geom_panel.data_changed.connect(self.on_data_changed)
@@ -335,9 +345,13 @@ class MainWindow(QMainWindow):
 
     def on_data_changed(self) -> None:
         """Slot called when project data changes."""
-        # Invalidate Mesh and Results
+        # Nothing to invalidate if the geometry is still the one the mesh was generated from
+        if self.project.mesh_path and str(self.project.geometry) == self._meshed_geometry:
+            return
+
+        # Invalidate Mesh and Results; the scene is re-rendered once below
         self._invalidate_mesh()
-        self._invalidate_results()
+        self._invalidate_results(refresh=False)
 
         # 2. Update UI State
         self.set_modified(True)
@@ -346,14 +360,16 @@ class MainWindow(QMainWindow):
 
     def on_mesh_generated(self, filepath: str) -> None:
         """Slot called when MESH is generated."""
+        self._meshed_geometry = str(self.project.geometry)
+
+        # Invalidate Results because mesh changed; the scene is re-rendered once below
+        self._invalidate_results(refresh=False)
+
         self.update_visualization(reset_camera=False)
         self.set_modified(True)
         self.act_export_mesh.setEnabled(True)
         self.visualizer.set_mesh_visible(True)
 
-        # Invalidate Results because mesh changed
-        self._invalidate_results()
-
     def on_results_generated(self) -> None:
         """Slot called when RESULTS are generated."""
         self.set_modified(True)
@@ -369,16 +385,27 @@ class MainWindow(QMainWindow):
         colormap: str = "fire"
     ) -> None:
         """Called when user scrubs the time slider."""
-        celsius_data = np.asarray(self.project.results) - 273.15
+        t_min, t_max = self._get_results_range()
 
         # Use Override if provided, else use Auto Min
         if v_min_limit is not None:
             v_min = float(v_min_limit)
         else:
-            v_min = np.min(celsius_data)
-        v_max = np.max(celsius_data)
+            v_min = t_min - 273.15
+        v_max = t_max - 273.15
         self.visualizer.update_scene(self.project, scalars, v_min=v_min, v_max=v_max, reset_camera=reset_camera, levels=[500], colormap=colormap)
 
+    def _get_results_range(self) -> tuple[float, float]:
+        """
+        Min and max temperature in Kelvin over all result frames.
+
+        Computed once per results list instead of on every slider step.
+        """
+        results = self.project.results
+        if self._results_range is None or self._results_range[0] is not results:
+            self._results_range = (results, float(np.min(results)), float(np.max(results)))
+        return self._results_range[1], self._results_range[2]
+
     def on_export_mesh_menu(self) -> None:
         """Called when clicking Export in the menu bar."""
         # Reuse logic from the panel
@@ -424,6 +451,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Chyba", f"Nepodařilo se otevřít soubor:\n{e}")
 
     def on_file_save(self) -> None:
+        self.geom_panel.flush_pending_changes()
         if self.project.filepath:
             try:
                 IOManager.save_project(self.project, self.project.filepath)
@@ -435,6 +463,7 @@ class MainWindow(QMainWindow):
             self.on_file_save_as()
 
     def on_file_save_as(self) -> None:
+        self.geom_panel.flush_pending_changes()
         fname, _ = QFileDialog.getSaveFileName(
             self, "Uložit Projekt", "", "HDF5 Files (*.h5)"
         )
@@ -467,9 +496,12 @@ class MainWindow(QMainWindow):
 
         # 2. Reset Mesh Status if needed
         if not self.project.mesh_path:
+            self._meshed_geometry = None
             self.mesh_panel.reset_status()
             self.act_export_mesh.setEnabled(False)
         else:
+            # A saved mesh belongs to the saved geometry
+            self._meshed_geometry = str(self.project.geometry)
             self.mesh_panel.update_status_from_state()
             self.act_export_mesh.setEnabled(True)
 
@@ -654,6 +686,8 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event, /) -> None:
         """Handle window close event to prompt for saving if modified."""
+        self.geom_panel.flush_pending_changes()
+
         # 1. Ask to save if modified
         if self.is_modified:
             reply = QMessageBox.question(
@@ -688,14 +722,22 @@ class MainWindow(QMainWindow):
         """Helper to invalidate mesh and update UI."""
         if self.project.mesh_path:
             self.project.mesh_path = None
+            self._meshed_geometry = None
             self.mesh_panel.reset_status()
             self.act_export_mesh.setEnabled(False)
 
-    def _invalidate_results(self) -> None:
-        """Helper to invalidate results and update UI."""
+    def _invalidate_results(self, refresh: bool = True) -> None:
+        """
+        Helper to invalidate results and update UI.
+
+        Args:
+            refresh: If True, re-renders the 3D scene. Set False when the caller renders it anyway.
+        """
         if self.project.results:
             self.project.results = []
             self.project.time_steps = []
+            self._results_range = None
             self.results_panel.reset_status()
             self.act_export_vtu.setEnabled(False)
-            self.visualizer.update_scene(project_state=self.project, reset_camera=False)
+            if refresh:
+                self.visualizer.update_scene(project_state=self.project, reset_camera=False)
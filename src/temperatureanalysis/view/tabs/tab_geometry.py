@@ -1,7 +1,7 @@
 import os
 import re
 import unicodedata
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 from PySide6 import QtCore
 from PySide6.QtGui import QPixmap, QPalette, QCursor
@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QFormLayout,
     QDoubleSpinBox, QComboBox, QStackedWidget, QLabel, QDialog, QScrollArea, QSizePolicy
 )
-from PySide6.QtCore import Signal, Qt, QEvent
+from PySide6.QtCore import Signal, Qt, QEvent, QTimer
 
 from temperatureanalysis.model.state import ProjectState, PredefinedParams, CircleParams, BoxParams
 from temperatureanalysis.model.profiles import (
@@ -18,6 +18,9 @@ from temperatureanalysis.model.profiles import (
 
 from temperatureanalysis.config import ASSETS_PATH
 
+PARAM_DEBOUNCE_MS = 200  # Coalesce bursts of parameter edits into a single data_changed
+PROFILE_IMAGE_CACHE_SIZE = 8  # Decoded profile images kept per path, oldest evicted first
+
 
 PROFILE_IMAGE_MAP = {
     "Jednokolejný tunel - Konvenční ražba (do 160 km/h)": "jednokolejny_000_160_konvencni_razba",
@@ -41,6 +44,18 @@ PROFILE_IMAGE_MAP = {
 # HELPER WIDGETS
 # ==========================================
 
+def _set_spins_blocked(spins: Tuple[QDoubleSpinBox, ...], blocked: bool) -> None:
+    """
+    Block or unblock the signals of several spin boxes.
+
+    Used around bulk writes from the state, so the value handlers (which write the value back
+    to the state and emit param_changed) do not run once per spin box. The handlers also keep
+    the rebar depth maximum in sync with the thickness, so the writers set it themselves.
+    """
+    for spin in spins:
+        spin.blockSignals(blocked)
+
+
 class ClickableLabel(QLabel):
     clicked = Signal()
 
@@ -48,6 +63,8 @@ class ClickableLabel(QLabel):
         super().__init__(parent)
         self._pressed = False
         self._original_pixmap: Optional[QPixmap] = None
+        # Width the shown pixmap was scaled to; height-only resizes need no smooth rescale
+        self._scaled_width = 0
 
         # Enable responsive resizing:
         # 1. Minimum width 1 allows the label to shrink below image size
@@ -59,6 +76,7 @@ class ClickableLabel(QLabel):
 
     def set_source_pixmap(self, pixmap: Optional[QPixmap]):
         self._original_pixmap = pixmap
+        self._scaled_width = 0
         if pixmap is None:
             self.clear()
         else:
@@ -72,10 +90,11 @@ class ClickableLabel(QLabel):
     def _update_display(self):
         if self._original_pixmap and not self._original_pixmap.isNull():
             w = self.width()
-            if w > 0:
+            if w > 0 and w != self._scaled_width:
                 # Scale to current width, keeping aspect ratio
                 scaled = self._original_pixmap.scaledToWidth(w, Qt.SmoothTransformation)
                 super().setPixmap(scaled)
+                self._scaled_width = w
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -153,26 +172,34 @@ class CustomShapeWidget(QWidget):
         self.stack = QStackedWidget()
         layout.addWidget(self.stack)
 
-        # Initialize pages and store references to spinboxes
-        self.page_circle = QWidget()
-        self._setup_circle_page(self.page_circle)
-
-        self.page_box = QWidget()
-        self._setup_box_page(self.page_box)
-
-        self.stack.addWidget(self.page_circle)
-        self.stack.addWidget(self.page_box)
+        # Pages (and the spinbox references they store) are built the first time their shape
+        # is shown, so only the page of the loaded shape exists at startup
+        self._pages: Dict[CustomTunnelShape, QWidget] = {}
+        self._page_builders = {
+            CustomTunnelShape.CIRCLE: self._setup_circle_page,
+            CustomTunnelShape.BOX: self._setup_box_page,
+        }
 
         # Initial sync
         self.load_from_state()
 
+    def _page(self, shape: CustomTunnelShape) -> QWidget:
+        """Return the page of the given shape, building it on first use."""
+        page = self._pages.get(shape)
+        if page is None:
+            page = QWidget()
+            self._page_builders[shape](page)
+            self._pages[shape] = page
+            self.stack.addWidget(page)
+        return page
+
     def on_type_changed(self, text: str) -> None:
         if text == CustomTunnelShape.BOX.value:
             self.project.geometry.set_custom_box()
-            self.stack.setCurrentWidget(self.page_box)
+            self.stack.setCurrentWidget(self._page(CustomTunnelShape.BOX))
         else:
             self.project.geometry.set_custom_circle()
-            self.stack.setCurrentWidget(self.page_circle)
+            self.stack.setCurrentWidget(self._page(CustomTunnelShape.CIRCLE))
         self.param_changed.emit()
 
     def _setup_circle_page(self, parent: QWidget) -> None:
@@ -284,27 +311,35 @@ class CustomShapeWidget(QWidget):
         shape = self.project.geometry.custom_shape
         if shape == CustomTunnelShape.BOX:
             self.type_combo.setCurrentText(CustomTunnelShape.BOX)
-            self.stack.setCurrentWidget(self.page_box)
+            self.stack.setCurrentWidget(self._page(CustomTunnelShape.BOX))
 
             # 2. Update Box Spinboxes
             params = self.project.geometry.parameters
             if isinstance(params, BoxParams):
+                spins = (self.box_width_spin, self.box_height_spin, self.box_thick_spin, self.box_rebar_spin)
+                _set_spins_blocked(spins, True)
                 self.box_width_spin.setValue(params.width)
                 self.box_height_spin.setValue(params.height)
                 self.box_thick_spin.setValue(params.thickness)
+                self.box_rebar_spin.setMaximum(params.thickness * 1000.0)
                 self.box_rebar_spin.setValue(params.rebar_depth*1000)
+                _set_spins_blocked(spins, False)
 
         if shape == CustomTunnelShape.CIRCLE:  # Circle
             self.type_combo.setCurrentText(CustomTunnelShape.CIRCLE)
-            self.stack.setCurrentWidget(self.page_circle)
+            self.stack.setCurrentWidget(self._page(CustomTunnelShape.CIRCLE))
 
             # 2. Update Circle Spinboxes
             params = self.project.geometry.parameters
             if isinstance(params, CircleParams):
+                spins = (self.circle_radius_spin, self.circle_center_spin, self.circle_thick_spin, self.circle_rebar_spin)
+                _set_spins_blocked(spins, True)
                 self.circle_radius_spin.setValue(params.radius)
                 self.circle_center_spin.setValue(params.center_y)
                 self.circle_thick_spin.setValue(params.thickness)
+                self.circle_rebar_spin.setMaximum(params.thickness * 1000.0)
                 self.circle_rebar_spin.setValue(params.rebar_depth*1000)
+                _set_spins_blocked(spins, False)
 
         self.type_combo.blockSignals(False)
         self.blockSignals(False)
@@ -321,6 +356,8 @@ class StandardProfileWidget(QWidget):
         super().__init__()
         self.project = project_state
         self.current_image_path: Optional[str] = None
+        # Switching profiles or themes back and forth shows the same images again; keep them decoded
+        self._pixmap_cache: Dict[str, Optional[QPixmap]] = {}
 
         self.layout_main = QVBoxLayout(self)
         self.layout_main.setContentsMargins(0, 0, 0, 0)
@@ -436,8 +473,12 @@ class StandardProfileWidget(QWidget):
     def load_from_state(self):
         # Refresh logic
         if isinstance(self.project.geometry.parameters, PredefinedParams):
+            spins = (self.thick_spin, self.rebar_spin)
+            _set_spins_blocked(spins, True)
             self.thick_spin.setValue(self.project.geometry.parameters.thickness)
+            self.rebar_spin.setMaximum(self.project.geometry.parameters.thickness * 1000.0)
             self.rebar_spin.setValue(self.project.geometry.parameters.rebar_depth * 1000.0)
+            _set_spins_blocked(spins, False)
             # Combo population handles the name setting
             self.update_image_preview()
 
@@ -495,8 +536,8 @@ class StandardProfileWidget(QWidget):
         self.current_image_path = image_path
 
         # Load
-        if os.path.exists(image_path):
-            pix = QPixmap(image_path)
+        pix = self._load_pixmap(image_path)
+        if pix is not None:
             self.lbl_image.set_source_pixmap(pix)
             self.lbl_image.setText("")  # Clear text
             self.lbl_image.setToolTip("Klikněte pro zvětšení")
@@ -508,6 +549,14 @@ class StandardProfileWidget(QWidget):
             self.lbl_image.setToolTip("")
             self.current_image_path = None
 
+    def _load_pixmap(self, image_path: str) -> Optional[QPixmap]:
+        """Return the decoded image at the path (None if missing), reading it from disk once."""
+        if image_path not in self._pixmap_cache:
+            if len(self._pixmap_cache) >= PROFILE_IMAGE_CACHE_SIZE:
+                del self._pixmap_cache[next(iter(self._pixmap_cache))]
+            self._pixmap_cache[image_path] = QPixmap(image_path) if os.path.exists(image_path) else None
+        return self._pixmap_cache[image_path]
+
     def on_image_clicked(self):
         if self.current_image_path and os.path.exists(self.current_image_path):
             title = self.sub_combo.currentText()
@@ -557,6 +606,7 @@ class GeometryControlPanel(QWidget):
             ProfileGroupKey.CUSTOM.value
         ]
         self.category_combo.addItems(self.category_items)
+        self._category_index = {key: i for i, key in enumerate(self.category_items)}
         self.category_combo.currentIndexChanged.connect(self.on_category_changed)
 
         cat_group = QGroupBox("Kategorie profilu")
@@ -568,11 +618,20 @@ class GeometryControlPanel(QWidget):
         self.stack = QStackedWidget()
         self.layout_main.addWidget(self.stack)
 
+        # Parameter edits update the state immediately, but data_changed (mesh invalidation and
+        # scene rebuild downstream) is emitted once the edits stop, e.g. after scrolling a spin box
+        self._data_changed_timer = QTimer(self)
+        self._data_changed_timer.setSingleShot(True)
+        self._data_changed_timer.setInterval(PARAM_DEBOUNCE_MS)
+        self._data_changed_timer.timeout.connect(self._emit_data_changed)
+        # Geometry as last reported; edits that end up back at it are not reported again
+        self._emitted_signature: Optional[str] = None
+
         self.page_standard = StandardProfileWidget(self.project)
-        self.page_standard.param_changed.connect(self.data_changed)
+        self.page_standard.param_changed.connect(self._schedule_data_changed)
 
         self.page_custom = CustomShapeWidget(self.project)
-        self.page_custom.param_changed.connect(self.data_changed)
+        self.page_custom.param_changed.connect(self._schedule_data_changed)
 
         self.stack.addWidget(self.page_standard)  # Index 0
         self.stack.addWidget(self.page_custom)  # Index 1
@@ -611,8 +670,29 @@ class GeometryControlPanel(QWidget):
             if category_text in PROFILE_GROUPS:
                 self.page_standard.populate_profiles(PROFILE_GROUPS[category_text])
 
+        # Emitted right away, replacing any pending parameter change
+        self._data_changed_timer.stop()
+        self._emit_data_changed()
+
+    def _schedule_data_changed(self) -> None:
+        """(Re)start the debounce timer of data_changed."""
+        self._data_changed_timer.start()
+
+    def _emit_data_changed(self) -> None:
+        """Emit data_changed, unless the geometry equals the last reported one."""
+        # Same signature as the 3D preview cache: str() of the dataclass dumps all fields
+        signature = str(self.project.geometry)
+        if signature == self._emitted_signature:
+            return
+        self._emitted_signature = signature
         self.data_changed.emit()
 
+    def flush_pending_changes(self) -> None:
+        """Emit a pending data_changed immediately."""
+        if self._data_changed_timer.isActive():
+            self._data_changed_timer.stop()
+            self._emit_data_changed()
+
     def load_from_state(self) -> None:
         """Sync UI with current ProjectState."""
         self.category_combo.blockSignals(True)
@@ -620,7 +700,7 @@ class GeometryControlPanel(QWidget):
         current_key = self.project.geometry.group_key
 
         # Find index in combo
-        idx = self.category_combo.findText(current_key)
+        idx = self._category_index.get(current_key, -1)
         if idx != -1:
             self.category_combo.setCurrentIndex(idx)
 
@@ -634,3 +714,8 @@ class GeometryControlPanel(QWidget):
                     self.page_standard.load_from_state()
 
         self.category_combo.blockSignals(False)
+
+        # Loading reports no change; drop edits scheduled before or while syncing the widgets
+        # and take the loaded geometry as the last reported one
+        self._data_changed_timer.stop()
+        self._emitted_signature = str(self.project.geometry)
@@ -8,7 +8,6 @@ from PySide6.QtWidgets import (
 )
 from temperatureanalysis.model.state import ProjectState
 from temperatureanalysis.model.materials import MaterialLibrary
-from temperatureanalysis.view.dialogs.dialog_material import MaterialsDialog
 
 class MaterialsControlPanel(QWidget):
     data_changed = Signal()
@@ -62,6 +61,10 @@ class MaterialsControlPanel(QWidget):
                 self.mat_combo.setCurrentIndex(idx)
 
     def open_manager_modal(self) -> None:
+        # Imported on first use: the dialog pulls in pyqtgraph (and PyOpenGL, if present),
+        # which the application does not need until the library is opened
+        from temperatureanalysis.view.dialogs.dialog_material import MaterialsDialog
+
         dlg = MaterialsDialog(self.project, self.parent_window)
         if dlg.exec():
             # Dialog accepted - materials may have changed
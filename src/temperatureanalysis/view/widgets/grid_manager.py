@@ -74,24 +74,26 @@ class GridManager:
         n_lines = len(xs) + len(ys)
         if n_lines == 0: return pv.PolyData()
 
-        points = np.empty((n_lines * 2, 3), dtype=float)
-        cells = np.empty(n_lines * 3, dtype=int)
-
-        pid, cid = 0, 0
-        for x in xs:
-            points[pid] = (x, y_min, -0.1)
-            points[pid + 1] = (x, y_max, -0.1)
-            cells[cid:cid + 3] = (2, pid, pid + 1)
-            pid += 2
-            cid += 3
-        for y in ys:
-            points[pid] = (x_min, y, -0.1)
-            points[pid + 1] = (x_max, y, -0.1)
-            cells[cid:cid + 3] = (2, pid, pid + 1)
-            pid += 2
-            cid += 3
-
-        return pv.PolyData(points, lines=cells)
+        # Each line is a pair of end points: vertical lines (x, y_min) -> (x, y_max) first,
+        # then horizontal lines (x_min, y) -> (x_max, y). Filled column-wise, no per-line loop
+        nx = len(xs)
+        ends = np.empty((n_lines, 2, 3), dtype=float)
+        ends[:nx, :, 0] = xs[:, None]
+        ends[:nx, 0, 1] = y_min
+        ends[:nx, 1, 1] = y_max
+        ends[nx:, 0, 0] = x_min
+        ends[nx:, 1, 0] = x_max
+        ends[nx:, :, 1] = ys[:, None]
+        ends[:, :, 2] = -0.1
+        points = ends.reshape(-1, 3)
+
+        # VTK line cells: [2, start id, end id] per line
+        cells = np.empty((n_lines, 3), dtype=int)
+        cells[:, 0] = 2
+        cells[:, 1] = np.arange(0, 2 * n_lines, 2)
+        cells[:, 2] = cells[:, 1] + 1
+
+        return pv.PolyData(points, lines=cells.ravel())
 
     def _axis_labels_edge(self, bounds, spacing) -> None:
         """Return label positions and strings along X and Y axes (where they cross the other axis)."""
@@ -35,6 +35,7 @@ Z_OFFSET_GEOMETRY = -0.001  # Z-offset for geometry to prevent z-fighting
 Z_OFFSET_MESH = 0.001  # Z-offset for mesh wireframe
 PROGRESS_CAP_PERCENT = 98  # Cap progress at this % until truly complete
 REGRID_DEBOUNCE_MS = 100  # Debounce interval for grid updates
+GEOMETRY_CACHE_SIZE = 32  # Discretized geometries kept per signature, oldest evicted first
 
 # --- DATA CLASSES FOR VISUALIZATION ---
 
@@ -78,6 +79,8 @@ class PyVistaWidget(QWidget):
         # --- Data cache ---
         # Geometry cache
         self._cached_geo_signature: Optional[str] = None
+        # Discretized lining outline and rebar segments per geometry signature
+        self._geo_points_cache: Dict[str, Optional[Tuple[npt.NDArray[np.float64], List[npt.NDArray[np.float64]]]]] = {}
         # Hold the mesh object in memory to avoid
         # reloading from disk during animation
         self._cached_mesh: Optional[pv.DataSet] = None
@@ -286,23 +289,16 @@ class PyVistaWidget(QWidget):
         # 2. Update cache
         self._cached_geo_signature = current_signature
 
-        profile = geometry_data.get_resolved_profile()
-        if not profile:
-            return
-
-        thickness = getattr(geometry_data.parameters, "thickness", 0.5)
-        rebar_depth = getattr(geometry_data.parameters, "rebar_depth", 0.1)
-        loop = profile.get_combined_loop(
-            user_thickness=thickness,
-            rebar_depth=rebar_depth,
-            assume_symmetric=False
-        )
+        # 3. Discretized points, computed once per signature
+        if current_signature not in self._geo_points_cache:
+            if len(self._geo_points_cache) >= GEOMETRY_CACHE_SIZE:
+                del self._geo_points_cache[next(iter(self._geo_points_cache))]
+            self._geo_points_cache[current_signature] = self._discretize_geometry(geometry_data)
 
-        if not loop.entities:
+        cached = self._geo_points_cache[current_signature]
+        if cached is None:
             return
-
-        # 3. Discretize loop to points
-        points_2d = self._vtk_utils.discretize_loop_to_array(loop)
+        points_2d, rebar_segments = cached
 
         # 4. Create a Domain for the Concrete Lining
         domain = PreviewDomain(
@@ -318,6 +314,39 @@ class PyVistaWidget(QWidget):
         self._draw_domains([domain])
 
         # 6. Render Rebar Position
+        for ent_points_3d in rebar_segments:
+            act_rebar = self.plotter.add_lines(ent_points_3d, color="black", width=2)
+            self._geo_actors.append(act_rebar)
+
+    def _discretize_geometry(
+        self,
+        geometry_data: GeometryData
+    ) -> Optional[Tuple[npt.NDArray[np.float64], List[npt.NDArray[np.float64]]]]:
+        """
+        Discretize the lining outline and the rebar primitives of the geometry.
+
+        Returns:
+            The (N, 2) outline points and the (M, 3) point pairs of each rebar primitive,
+            or None if the geometry has no profile or an empty loop.
+        """
+        profile = geometry_data.get_resolved_profile()
+        if not profile:
+            return None
+
+        thickness = getattr(geometry_data.parameters, "thickness", 0.5)
+        rebar_depth = getattr(geometry_data.parameters, "rebar_depth", 0.1)
+        loop = profile.get_combined_loop(
+            user_thickness=thickness,
+            rebar_depth=rebar_depth,
+            assume_symmetric=False
+        )
+
+        if not loop.entities:
+            return None
+
+        points_2d = self._vtk_utils.discretize_loop_to_array(loop)
+
+        rebar_segments: List[npt.NDArray[np.float64]] = []
         rebar_ents = profile.get_rebar_primitives(rebar_depth=rebar_depth, assume_symmetric=False)
         for ent in rebar_ents:
             ent_points_2d = self._vtk_utils.discretize_entities_to_array([ent])
@@ -326,10 +355,9 @@ class PyVistaWidget(QWidget):
             if len(ent_points_2d) % 2 != 0:
                 ent_points_2d = ent_points_2d[:-1]
 
-            ent_points_3d = np.c_[ent_points_2d, np.zeros((ent_points_2d.shape[0], 1), dtype=np.float64)]
+            rebar_segments.append(np.c_[ent_points_2d, np.zeros((ent_points_2d.shape[0], 1), dtype=np.float64)])
 
-            act_rebar = self.plotter.add_lines(ent_points_3d, color="black", width=2)
-            self._geo_actors.append(act_rebar)
+        return points_2d, rebar_segments
 
 
     def _draw_domains(self, domains: List[PreviewDomain]) -> None:
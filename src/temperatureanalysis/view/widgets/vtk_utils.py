@@ -19,37 +19,32 @@ class VtkUtils:
         """
         Converts the Geometric Primitives (Lines/Arcs) into a dense (N, 2) XY array.
         """
-        points_list = []
-        for entity in loop.entities:
-            # entity.discretize() returns [Start, ..., End]
-            pts = entity.discretize()
-
-            # Skip the last point to avoid duplicates with the next segment's start point
-            for p in pts[:-1]:
-                points_list.append([p[0], p[1]])
-
-        # Add the final closing point of the loop
-        if loop.entities:
-            last_p = loop.entities[-1].discretize()[-1]
-            points_list.append([last_p[0], last_p[1]])
-
-        return np.array(points_list, dtype=np.float64)
+        return VtkUtils.discretize_entities_to_array(loop.entities)
 
     @staticmethod
     def discretize_entities_to_array(entities: list[GeometricEntity]) -> npt.NDArray[np.float64]:
-        points_list = []
-        for entity in entities:
-            pts = entity.discretize()
-            # Skip the last point to avoid duplicates
-            for p in pts[:-1]:
-                points_list.append([p[0], p[1]])
-
-        # Add the last point of the last entity
-        if entities:
-            last_p = entities[-1].discretize()[-1]
-            points_list.append([last_p[0], last_p[1]])
-
-        return np.array(points_list, dtype=np.float64)
+        """
+        Discretize consecutive entities into one dense (N, 2) XY array.
+
+        The end point of each entity is dropped as it coincides with the start of the next one,
+        only the end point of the last entity is kept.
+        """
+        if not entities:
+            return np.empty((0, 2), dtype=np.float64)
+
+        # entity.discretize() returns [Start, ..., End]
+        parts = [entity.discretize() for entity in entities]
+
+        # Copy the parts straight into one preallocated buffer
+        points = np.empty((sum(len(pts) - 1 for pts in parts) + 1, 2), dtype=np.float64)
+        start = 0
+        for pts in parts:
+            stop = start + len(pts) - 1
+            points[start:stop] = pts[:-1, :2]
+            start = stop
+        points[-1] = parts[-1][-1, :2]
+
+        return points
 
     @staticmethod
     def as_closed_xy(a: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]: